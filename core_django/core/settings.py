@@ -65,6 +65,19 @@ else:
 # Database connection pooling
 DATABASES["default"]["CONN_MAX_AGE"] = 600
 
+# Prepared statements for repeated query shapes
+# With server-side binding, psycopg 3 prepares a statement once it has been
+# executed a few times on a connection, so the persistent connections above
+# skip re-parsing and re-planning the recurring API queries. psycopg2 has no
+# server-side binding, so this only applies when psycopg 3 is installed.
+if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+    try:
+        import psycopg  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        DATABASES["default"].setdefault("OPTIONS", {})["server_side_binding"] = True
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
@@ -17,6 +17,7 @@ from django.core.management.base import BaseCommand, CommandError
 
 from core_django.models.models import DailyWeather, WeatherStation
 from core_django.utils.async_bulk_writer import BulkWriterConfig, WeatherDataBulkWriter
+from src.utils.caching import STATIONS_CACHE_TAG, invalidate_cache_tag
 
 
 class Command(BaseCommand):
@@ -91,6 +92,9 @@ class Command(BaseCommand):
             asyncio.run(self.process_files_async(weather_files))
         except Exception as e:
             raise CommandError(f"Error during async processing: {e}")
+        finally:
+            if not self.dry_run:
+                self.invalidate_api_cache()
 
     async def process_files_async(self, weather_files):
         """Process all weather files using async bulk operations."""
@@ -206,6 +210,17 @@ class Command(BaseCommand):
 
         self.stdout.write(f"   • Deleted {daily_count:,} daily weather records")
         self.stdout.write(f"   • Deleted {station_count:,} weather stations")
+        self.invalidate_api_cache()
+
+    def invalidate_api_cache(self):
+        """
+        Drop the API's cached station listings.
+
+        Bulk creates and queryset deletes don't reach the API's model signal
+        receivers, so cached pages (shared through Redis) are invalidated
+        explicitly after every write.
+        """
+        invalidate_cache_tag(STATIONS_CACHE_TAG)
 
     def get_weather_files(self) -> list[str]:
         """Get all weather data files from the data directory."""
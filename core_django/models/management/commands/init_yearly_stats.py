@@ -11,10 +11,10 @@ Usage:
 import asyncio
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db import models
 from django.db.models import Avg, Count, Max, Min, Sum
+from django.db.models.functions import ExtractYear
 
-from core_django.models.models import DailyWeather, WeatherStation, YearlyWeatherStats
+from core_django.models.models import DailyWeather, YearlyWeatherStats
 from core_django.utils.async_bulk_writer import BulkWriterConfig, WeatherDataBulkWriter
 from core_django.utils.units import round_to_decimal
 
@@ -90,17 +90,17 @@ class Command(BaseCommand):
 
     async def process_statistics_async(self):
         """Process yearly statistics using async bulk operations."""
-        # Get station-year combinations that need processing
-        combinations = self.get_station_year_combinations()
+        # One grouped aggregate computes every station-year at once
+        all_yearly_stats = await asyncio.to_thread(self.calculate_yearly_stats)
 
-        if not combinations:
+        if not all_yearly_stats:
             self.stdout.write(
                 self.style.WARNING("⚠️  No station-year combinations found to process")
             )
             return
 
         self.stdout.write(
-            f"📋 Found {len(combinations):,} station-year combinations to process"
+            f"📋 Calculated {len(all_yearly_stats):,} station-year statistics"
         )
         self.stdout.write(f"📦 Batch size: {self.batch_size}")
         self.stdout.write(f"🔄 Max concurrent batches: {self.max_concurrent_batches}")
@@ -115,29 +115,8 @@ class Command(BaseCommand):
 
         bulk_writer = WeatherDataBulkWriter(config)
 
-        # Process combinations in chunks and calculate statistics
-        all_yearly_stats = []
-        chunk_size = self.batch_size * self.max_concurrent_batches
-
-        for i in range(0, len(combinations), chunk_size):
-            chunk = combinations[i : i + chunk_size]
-
-            if self.verbosity >= 1:
-                chunk_num = (i // chunk_size) + 1
-                total_chunks = (len(combinations) + chunk_size - 1) // chunk_size
-                self.stdout.write(
-                    f"\n📊 Processing chunk {chunk_num}/{total_chunks}..."
-                )
-
-            # Calculate statistics for this chunk concurrently
-            chunk_stats = await self.calculate_chunk_statistics_async(chunk)
-            all_yearly_stats.extend(chunk_stats)
-
-            if self.verbosity >= 2:
-                self.stdout.write(f"   ✅ Calculated {len(chunk_stats)} statistics")
-
         # Bulk create all statistics
-        if not self.dry_run and all_yearly_stats:
+        if not self.dry_run:
             self.stdout.write(
                 f"\n🏗️  Creating {len(all_yearly_stats):,} yearly statistics..."
             )
@@ -156,114 +135,85 @@ class Command(BaseCommand):
             self.style.SUCCESS("\n🎉 Yearly statistics calculation complete!")
         )
         self.stdout.write("📊 Summary:")
-        self.stdout.write(
-            f"   • Station-year combinations processed: {len(combinations):,}"
-        )
         self.stdout.write(f"   • Yearly statistics created: {len(all_yearly_stats):,}")
 
         if not self.dry_run:
             # Verify database counts
-            db_stats = YearlyWeatherStats.objects.count()
+            db_stats = await asyncio.to_thread(YearlyWeatherStats.objects.count)
             self.stdout.write("\n📋 Database verification:")
             self.stdout.write(f"   • Yearly statistics in DB: {db_stats:,}")
 
-    async def calculate_chunk_statistics_async(self, combinations):
-        """Calculate statistics for a chunk of station-year combinations concurrently."""
-        tasks = [
-            self.calculate_yearly_stats_async(station_id, year)
-            for station_id, year in combinations
-        ]
-
-        # Execute calculations concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Filter out None results and exceptions
-        stats = []
-        for result in results:
-            if result and not isinstance(result, Exception):
-                stats.append(result)
-            elif isinstance(result, Exception) and self.verbosity >= 2:
-                self.stdout.write(
-                    self.style.WARNING(f"   ⚠️  Error calculating statistics: {result}")
-                )
+    def calculate_yearly_stats(self) -> list[YearlyWeatherStats]:
+        """
+        Aggregate daily weather into yearly statistics with one grouped query.
 
-        return stats
+        COUNT(column) skips NULLs, so the data quality counts come from the
+        same GROUP BY (station, year) pass as the averages and totals.
+        """
+        daily_records = DailyWeather.objects.all()
 
-    async def calculate_yearly_stats_async(
-        self, station_id: str, year: int
-    ) -> YearlyWeatherStats | None:
-        """Calculate yearly statistics for a specific station and year asynchronously."""
-        # Get the weather station
-        try:
-            station = await asyncio.to_thread(
-                WeatherStation.objects.get, station_id=station_id
+        # Apply filters if specified
+        if self.target_station:
+            daily_records = daily_records.filter(station_id=self.target_station)
+        if self.target_year:
+            daily_records = daily_records.filter(date__year=self.target_year)
+
+        grouped = (
+            daily_records.values("station_id", year=ExtractYear("date"))
+            .annotate(
+                # Data quality metrics come first: later aliases such as
+                # max_temp would otherwise shadow the columns counted here
+                total_records=Count("id"),
+                records_with_temp=Count("max_temp"),
+                records_with_precipitation=Count("precipitation"),
+                # Temperature statistics
+                avg_max_temp=Avg("max_temp"),
+                avg_min_temp=Avg("min_temp"),
+                max_temp=Max("max_temp"),
+                min_temp=Min("min_temp"),
+                # Precipitation statistics
+                total_precipitation=Sum("precipitation"),
+                avg_precipitation=Avg("precipitation"),
+                max_precipitation=Max("precipitation"),
             )
-        except WeatherStation.DoesNotExist:
-            if self.verbosity >= 2:
-                self.stdout.write(
-                    self.style.WARNING(f"   ⚠️  Station {station_id} not found")
-                )
-            return None
-
-        # Get daily records for this station and year
-        daily_records = DailyWeather.objects.filter(station=station, date__year=year)
-
-        # Check if records exist
-        records_exist = await asyncio.to_thread(daily_records.exists)
-        if not records_exist:
-            return None
-
-        # Calculate basic aggregate statistics
-        aggregates = await asyncio.to_thread(
-            daily_records.aggregate,
-            # Temperature statistics
-            avg_max_temp=Avg("max_temp"),
-            avg_min_temp=Avg("min_temp"),
-            max_temp=Max("max_temp"),
-            min_temp=Min("min_temp"),
-            # Precipitation statistics
-            total_precipitation=Sum("precipitation"),
-            avg_precipitation=Avg("precipitation"),
-            max_precipitation=Max("precipitation"),
-            # Data quality metrics
-            total_records=Count("id"),
-        )
-
-        # Calculate data quality metrics separately to avoid aggregation conflicts
-        records_with_temp = await asyncio.to_thread(
-            daily_records.filter(max_temp__isnull=False).count
-        )
-        records_with_precipitation = await asyncio.to_thread(
-            daily_records.filter(precipitation__isnull=False).count
-        )
-
-        aggregates["records_with_temp"] = records_with_temp
-        aggregates["records_with_precipitation"] = records_with_precipitation
-
-        # Create YearlyWeatherStats object
-        yearly_stats = YearlyWeatherStats(
-            station=station,
-            year=year,
-            avg_max_temp=round_to_decimal(aggregates["avg_max_temp"]),
-            avg_min_temp=round_to_decimal(aggregates["avg_min_temp"]),
-            max_temp=aggregates["max_temp"],
-            min_temp=aggregates["min_temp"],
-            total_precipitation=aggregates["total_precipitation"],
-            avg_precipitation=round_to_decimal(aggregates["avg_precipitation"]),
-            max_precipitation=aggregates["max_precipitation"],
-            total_records=aggregates["total_records"],
-            records_with_temp=aggregates["records_with_temp"],
-            records_with_precipitation=aggregates["records_with_precipitation"],
+            .order_by("station_id", "year")
         )
 
-        if self.verbosity >= 3:
-            self.stdout.write(
-                f"   📊 {station_id}-{year}: "
-                f"Records={aggregates['total_records']}, "
-                f"AvgMaxTemp={yearly_stats.avg_max_temp_celsius}°C, "
-                f"TotalPrecip={yearly_stats.total_precipitation_mm}mm"
+        # Skip station-years that already have statistics
+        existing = set()
+        if not self.dry_run:
+            existing = set(YearlyWeatherStats.objects.values_list("station_id", "year"))
+
+        yearly_stats = []
+        for row in grouped:
+            if (row["station_id"], row["year"]) in existing:
+                continue
+
+            yearly_stats.append(
+                YearlyWeatherStats(
+                    station_id=row["station_id"],
+                    year=row["year"],
+                    avg_max_temp=round_to_decimal(row["avg_max_temp"]),
+                    avg_min_temp=round_to_decimal(row["avg_min_temp"]),
+                    max_temp=row["max_temp"],
+                    min_temp=row["min_temp"],
+                    total_precipitation=row["total_precipitation"],
+                    avg_precipitation=round_to_decimal(row["avg_precipitation"]),
+                    max_precipitation=row["max_precipitation"],
+                    total_records=row["total_records"],
+                    records_with_temp=row["records_with_temp"],
+                    records_with_precipitation=row["records_with_precipitation"],
+                )
             )
 
+            if self.verbosity >= 3:
+                self.stdout.write(
+                    f"   📊 {row['station_id']}-{row['year']}: "
+                    f"Records={row['total_records']}, "
+                    f"AvgMaxTemp={yearly_stats[-1].avg_max_temp_celsius}°C, "
+                    f"TotalPrecip={yearly_stats[-1].total_precipitation_mm}mm"
+                )
+
         return yearly_stats
 
     def progress_callback(self, current: int, total: int):
@@ -279,31 +229,3 @@ class Command(BaseCommand):
         YearlyWeatherStats.objects.all().delete()
 
         self.stdout.write(f"   • Deleted {stats_count:,} yearly statistics")
-
-    def get_station_year_combinations(self) -> list[tuple[str, int]]:
-        """Get all station-year combinations that have daily data."""
-        query = DailyWeather.objects.values("station_id", "date__year").distinct()
-
-        # Apply filters if specified
-        if self.target_station:
-            query = query.filter(station_id=self.target_station)
-        if self.target_year:
-            query = query.filter(date__year=self.target_year)
-
-        # If not in dry run mode, exclude combinations that already have statistics
-        if not self.dry_run:
-            existing_stats = YearlyWeatherStats.objects.values_list(
-                "station_id", "year"
-            )
-            if existing_stats:
-                query = query.exclude(
-                    models.Q(station_id__in=[s[0] for s in existing_stats])
-                    & models.Q(date__year__in=[s[1] for s in existing_stats])
-                )
-
-        combinations = [
-            (item["station_id"], item["date__year"])
-            for item in query.order_by("station_id", "date__year")
-        ]
-
-        return combinations
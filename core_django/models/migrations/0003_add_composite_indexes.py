@@ -0,0 +1,44 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("models", "0002_add_checksum_models"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="dailyweather",
+            index=models.Index(
+                fields=["-date", "station", "id"], name="ix_daily_weather_date_desc"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dailyweather",
+            index=models.Index(
+                condition=models.Q(("max_temp__isnull", False)),
+                fields=["station", "-date"],
+                name="ix_daily_weather_has_temp",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dailyweather",
+            index=models.Index(
+                condition=models.Q(("precipitation__isnull", False)),
+                fields=["station", "-date"],
+                name="ix_daily_weather_has_precip",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="weatherstation",
+            index=models.Index(fields=["state", "name"], name="ix_stations_state_name"),
+        ),
+        migrations.AddIndex(
+            model_name="yearlyweatherstats",
+            index=models.Index(
+                fields=["-year", "station"], name="ix_yearly_stats_year_station"
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+"""
+Trigram indexes for case-insensitive station search.
+
+Station search filters with ``icontains``, which PostgreSQL renders as
+``UPPER(col::text) LIKE UPPER('%term%')``. A leading wildcard cannot use a
+btree index, so these GIN trigram indexes are built on exactly that
+expression. Other database backends keep their existing behaviour.
+"""
+
+from django.db import migrations
+
+SEARCH_INDEXES = {
+    "ix_stations_name_trgm": "name",
+    "ix_stations_station_id_trgm": "station_id",
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, column in SEARCH_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{index_name}" ON "weather_stations" '
+            f'USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for index_name in SEARCH_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("models", "0003_add_composite_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.7 on 2026-10-15 23:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("models", "0004_add_station_search_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="dailyweather",
+            index=models.Index(
+                fields=["date", "max_temp"],
+                include=("min_temp", "precipitation"),
+                name="ix_daily_weather_date_max_temp",
+            ),
+        ),
+    ]
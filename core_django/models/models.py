@@ -78,6 +78,8 @@ class WeatherStation(models.Model):
         indexes = [
             models.Index(fields=["state"]),
             models.Index(fields=["created_at"]),
+            # State equality filter followed by name ordering/search
+            models.Index(fields=["state", "name"], name="ix_stations_state_name"),
         ]
 
     def __str__(self):
@@ -131,6 +133,28 @@ class DailyWeather(models.Model):
             models.Index(fields=["station", "date", "max_temp"]),
             models.Index(fields=["station", "date", "min_temp"]),
             models.Index(fields=["station", "date", "precipitation"]),
+            # Date range scans returned newest-first, with the keyset tiebreaker
+            models.Index(
+                fields=["-date", "station", "id"], name="ix_daily_weather_date_desc"
+            ),
+            # Partial indexes backing has_temperature / has_precipitation filters
+            models.Index(
+                fields=["station", "-date"],
+                name="ix_daily_weather_has_temp",
+                condition=models.Q(max_temp__isnull=False),
+            ),
+            models.Index(
+                fields=["station", "-date"],
+                name="ix_daily_weather_has_precip",
+                condition=models.Q(precipitation__isnull=False),
+            ),
+            # Covering index for date + temperature range scans; the INCLUDE
+            # columns are only materialised on PostgreSQL
+            models.Index(
+                fields=["date", "max_temp"],
+                name="ix_daily_weather_date_max_temp",
+                include=["min_temp", "precipitation"],
+            ),
         ]
 
     def __str__(self):
@@ -271,6 +295,10 @@ class YearlyWeatherStats(models.Model):
             models.Index(fields=["year", "avg_max_temp"]),
             models.Index(fields=["year", "avg_min_temp"]),
             models.Index(fields=["year", "total_precipitation"]),
+            # Default newest-first listing, with station as the tiebreaker
+            models.Index(
+                fields=["-year", "station"], name="ix_yearly_stats_year_station"
+            ),
         ]
 
     def __str__(self):
@@ -243,7 +243,7 @@ class TestRunner:
         try:
             import importlib.util
 
-            if importlib.util.find_spec("pytest_xdist") is None:
+            if importlib.util.find_spec("xdist") is None:
                 print(
                     "pytest-xdist not available, install with: pip install pytest-xdist"
                 )
@@ -259,6 +259,8 @@ class TestRunner:
             "tests/",
             "-n",
             str(num_workers),
+            # Keep xdist_group-marked tests (latency measurements) on one worker
+            "--dist=loadgroup",
         ] + DEFAULT_PYTEST_ARGS
 
         return self.run_command(cmd)
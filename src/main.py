@@ -18,7 +18,7 @@ from django.core.exceptions import ImproperlyConfigured
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 # Add the project root to Python path for Django imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -202,6 +202,7 @@ app.include_router(
     filtered_endpoints.router,
     prefix="/api/v2",
     tags=["Enhanced API with Filtering & Pagination"],
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(
@@ -5,13 +5,19 @@ This module contains Pydantic models for combining filtering, sorting,
 and pagination parameters in API endpoints.
 """
 
+from typing import Literal
 
 from fastapi import Query
 from pydantic import BaseModel, Field
 
 from src.utils.filtering import FilterParams
 from src.utils.pagination import PaginationParams
-from src.utils.sorting import SortParams
+from src.utils.sorting import (
+    DailyWeatherSortField,
+    SortParams,
+    WeatherStationSortField,
+    YearlyStatsSortField,
+)
 
 
 class WeatherStationQueryParams(BaseModel):
@@ -39,6 +45,9 @@ class WeatherStationQueryParams(BaseModel):
     page_size: int = Field(
         default=20, ge=1, le=1000, description="Items per page", example=20
     )
+    cursor: str | None = Field(
+        None, description="Keyset cursor from a previous page (overrides page)"
+    )
 
     # Sorting
     sort_by: str = Field(
@@ -116,6 +125,9 @@ class DailyWeatherQueryParams(BaseModel):
     page_size: int = Field(
         default=50, ge=1, le=1000, description="Items per page", example=50
     )
+    cursor: str | None = Field(
+        None, description="Keyset cursor from a previous page (overrides page)"
+    )
 
     # Sorting
     sort_by: str = Field(default="date", description="Field to sort by", example="date")
@@ -194,6 +206,9 @@ class YearlyStatsQueryParams(BaseModel):
     page_size: int = Field(
         default=100, ge=1, le=1000, description="Items per page", example=100
     )
+    cursor: str | None = Field(
+        None, description="Keyset cursor from a previous page (overrides page)"
+    )
 
     # Sorting
     sort_by: str = Field(default="year", description="Field to sort by", example="year")
@@ -254,17 +269,22 @@ def create_weather_station_query_params(
     has_recent_data: bool | None = Query(None, description="Has recent data"),
     page: int = Query(1, ge=1, le=10000, description="Page number"),
     page_size: int = Query(20, ge=1, le=1000, description="Items per page"),
-    sort_by: str = Query("station_id", description="Sort field"),
-    sort_order: str = Query("asc", pattern="^(asc|desc)$", description="Sort order"),
+    cursor: str | None = Query(None, description="Keyset pagination cursor"),
+    sort_by: WeatherStationSortField = Query(
+        WeatherStationSortField.station_id, description="Sort field"
+    ),
+    sort_order: Literal["asc", "desc"] = Query("asc", description="Sort order"),
 ) -> WeatherStationQueryParams:
     """Dependency function for weather station query parameters."""
-    return WeatherStationQueryParams(
+    # Query() has already validated every value against the model's constraints
+    return WeatherStationQueryParams.model_construct(
         search=search,
         states=states,
         has_recent_data=has_recent_data,
         page=page,
         page_size=page_size,
-        sort_by=sort_by,
+        cursor=cursor,
+        sort_by=sort_by.value,
         sort_order=sort_order,
     )
 
@@ -276,23 +296,25 @@ def create_daily_weather_query_params(
     month: int | None = Query(None, ge=1, le=12, description="Filter by month"),
     min_temp: float | None = Query(None, description="Minimum temperature"),
     max_temp: float | None = Query(None, description="Maximum temperature"),
-    min_precipitation: float | None = Query(
-        None, ge=0.0, description="Min precipitation"
-    ),
-    max_precipitation: float | None = Query(
-        None, ge=0.0, description="Max precipitation"
-    ),
+    min_precipitation: float
+    | None = Query(None, ge=0.0, description="Min precipitation"),
+    max_precipitation: float
+    | None = Query(None, ge=0.0, description="Max precipitation"),
     station_ids: list[str] = Query(default_factory=list, description="Station IDs"),
     states: list[str] = Query(default_factory=list, description="State codes"),
     has_temperature: bool | None = Query(None, description="Has temperature data"),
     has_precipitation: bool | None = Query(None, description="Has precipitation data"),
     page: int = Query(1, ge=1, le=10000, description="Page number"),
     page_size: int = Query(50, ge=1, le=1000, description="Items per page"),
-    sort_by: str = Query("date", description="Sort field"),
-    sort_order: str = Query("desc", pattern="^(asc|desc)$", description="Sort order"),
+    cursor: str | None = Query(None, description="Keyset pagination cursor"),
+    sort_by: DailyWeatherSortField = Query(
+        DailyWeatherSortField.date, description="Sort field"
+    ),
+    sort_order: Literal["asc", "desc"] = Query("desc", description="Sort order"),
 ) -> DailyWeatherQueryParams:
     """Dependency function for daily weather query parameters."""
-    return DailyWeatherQueryParams(
+    # Query() has already validated every value against the model's constraints
+    return DailyWeatherQueryParams.model_construct(
         start_date=start_date,
         end_date=end_date,
         year=year,
@@ -307,7 +329,8 @@ def create_daily_weather_query_params(
         has_precipitation=has_precipitation,
         page=page,
         page_size=page_size,
-        sort_by=sort_by,
+        cursor=cursor,
+        sort_by=sort_by.value,
         sort_order=sort_order,
     )
 
@@ -318,24 +341,25 @@ def create_yearly_stats_query_params(
     years: list[int] = Query(default_factory=list, description="Specific years"),
     min_avg_temp: float | None = Query(None, description="Minimum average temperature"),
     max_avg_temp: float | None = Query(None, description="Maximum average temperature"),
-    min_total_precipitation: float | None = Query(
-        None, ge=0.0, description="Min total precipitation"
-    ),
-    max_total_precipitation: float | None = Query(
-        None, ge=0.0, description="Max total precipitation"
-    ),
+    min_total_precipitation: float
+    | None = Query(None, ge=0.0, description="Min total precipitation"),
+    max_total_precipitation: float
+    | None = Query(None, ge=0.0, description="Max total precipitation"),
     station_ids: list[str] = Query(default_factory=list, description="Station IDs"),
     states: list[str] = Query(default_factory=list, description="State codes"),
-    min_data_completeness: float | None = Query(
-        None, ge=0.0, le=100.0, description="Min completeness %"
-    ),
+    min_data_completeness: float
+    | None = Query(None, ge=0.0, le=100.0, description="Min completeness %"),
     page: int = Query(1, ge=1, le=10000, description="Page number"),
     page_size: int = Query(100, ge=1, le=1000, description="Items per page"),
-    sort_by: str = Query("year", description="Sort field"),
-    sort_order: str = Query("desc", pattern="^(asc|desc)$", description="Sort order"),
+    cursor: str | None = Query(None, description="Keyset pagination cursor"),
+    sort_by: YearlyStatsSortField = Query(
+        YearlyStatsSortField.year, description="Sort field"
+    ),
+    sort_order: Literal["asc", "desc"] = Query("desc", description="Sort order"),
 ) -> YearlyStatsQueryParams:
     """Dependency function for yearly statistics query parameters."""
-    return YearlyStatsQueryParams(
+    # Query() has already validated every value against the model's constraints
+    return YearlyStatsQueryParams.model_construct(
         start_year=start_year,
         end_year=end_year,
         years=years,
@@ -348,6 +372,7 @@ def create_yearly_stats_query_params(
         min_data_completeness=min_data_completeness,
         page=page,
         page_size=page_size,
-        sort_by=sort_by,
+        cursor=cursor,
+        sort_by=sort_by.value,
         sort_order=sort_order,
     )
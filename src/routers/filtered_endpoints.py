@@ -5,11 +5,15 @@ This module demonstrates the new query utilities by providing enhanced versions
 of existing endpoints with comprehensive filtering, sorting, and pagination.
 """
 
+import functools
 import logging
 from datetime import timedelta
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+import orjson
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from core_django.models.models import DailyWeather, WeatherStation, YearlyWeatherStats
 from src.models.query import (
@@ -25,6 +29,16 @@ from src.models.weather import (
     WeatherStationResponse,
     YearlyWeatherStatsResponse,
 )
+from src.utils.caching import (
+    STATIONS_CACHE_TAG,
+    CachePolicy,
+    create_304_response,
+    generate_etag,
+    get_cache_control_header,
+    get_tagged_cache_key,
+    invalidate_cache_tag,
+    should_return_304,
+)
 from src.utils.filtering import (
     DateRangeFilter,
     FilterParams,
@@ -43,6 +57,30 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Station listings are read far more often than stations change, so rendered
+# pages are kept in the Django cache (Redis when REDIS_URL is set). Any ORM
+# save or delete of a station, or of a daily record (which drives
+# has_recent_data), invalidates them all. Bulk loads fire no model signals,
+# so the loaders invalidate STATIONS_CACHE_TAG themselves.
+STATIONS_CACHE_TIMEOUT = 300
+
+
+def _invalidate_stations_cache(**kwargs: Any) -> None:
+    invalidate_cache_tag(STATIONS_CACHE_TAG)
+
+
+for _model in (WeatherStation, DailyWeather):
+    post_save.connect(
+        _invalidate_stations_cache,
+        sender=_model,
+        dispatch_uid=f"stations-cache-save-{_model.__name__}",
+    )
+    post_delete.connect(
+        _invalidate_stations_cache,
+        sender=_model,
+        dispatch_uid=f"stations-cache-delete-{_model.__name__}",
+    )
+
 
 @router.get(
     "/weather-stations", response_model=PaginatedResponse[WeatherStationResponse]
@@ -52,7 +90,7 @@ async def list_weather_stations_filtered(
     query_params: WeatherStationQueryParams = Depends(
         create_weather_station_query_params
     ),
-) -> PaginatedResponse[WeatherStationResponse]:
+) -> Response:
     """
     List weather stations with advanced filtering, sorting, and pagination.
 
@@ -61,9 +99,28 @@ async def list_weather_stations_filtered(
     - State-based filtering
     - Recent data availability filtering
     - Flexible sorting on multiple fields
-    - Pagination with navigation links
+    - Page or keyset (cursor) pagination with navigation links
+
+    Rendered pages are cached for a few minutes and dropped whenever station
+    or daily weather data is written through the ORM or bulk loaded.
     """
     try:
+        cache_key = get_tagged_cache_key(STATIONS_CACHE_TAG, request)
+
+        # The recent-data cutoff moves with the date, not with writes, so it
+        # is part of the key for requests that filter on it
+        recent_cutoff = None
+        if query_params.has_recent_data is not None:
+            from django.utils import timezone
+
+            # Use timezone-aware current date to avoid timezone issues
+            recent_cutoff = timezone.now().date() - timedelta(days=30)
+            cache_key = f"{cache_key}:{recent_cutoff.isoformat()}"
+
+        body = cache.get(cache_key)
+        if body is not None:
+            return Response(content=body, media_type="application/json")
+
         # Start with base queryset
         queryset = WeatherStation.objects.all()
 
@@ -79,14 +136,8 @@ async def list_weather_stations_filtered(
             state_filter = StateFilter(states=query_params.states)
             queryset = state_filter.apply_to_queryset(queryset, "state")
 
-        # Apply recent data filter with proper timezone handling
-        if query_params.has_recent_data is not None:
-            from django.utils import timezone
-
-            # Use timezone-aware current date to avoid timezone issues
-            current_date = timezone.now().date()
-            recent_cutoff = current_date - timedelta(days=30)
-
+        # Apply recent data filter
+        if recent_cutoff is not None:
             if query_params.has_recent_data:
                 queryset = queryset.filter(
                     daily_records__date__gte=recent_cutoff
@@ -107,7 +158,9 @@ async def list_weather_stations_filtered(
             page=query_params.page, page_size=query_params.page_size
         )
 
-        paginated_result = paginate_queryset(queryset, pagination_params, request)
+        paginated_result = paginate_queryset(
+            queryset, pagination_params, request, cursor=query_params.cursor
+        )
 
         # Convert to response models
         station_responses = [
@@ -115,13 +168,19 @@ async def list_weather_stations_filtered(
             for station in paginated_result.items
         ]
 
-        # Return paginated response
-        return PaginatedResponse[WeatherStationResponse](
+        result = PaginatedResponse[WeatherStationResponse](
             items=station_responses,
             pagination=paginated_result.pagination,
             links=paginated_result.links,
         )
 
+        # Cache the serialized page and return it as-is
+        body = _serialize_page(result)
+        cache.set(cache_key, body, STATIONS_CACHE_TIMEOUT)
+        return Response(content=body, media_type="application/json")
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error listing weather stations: {e}")
         raise HTTPException(
@@ -134,7 +193,7 @@ async def list_weather_stations_filtered(
 async def list_daily_weather_filtered(
     request: Request,
     query_params: DailyWeatherQueryParams = Depends(create_daily_weather_query_params),
-) -> PaginatedResponse[DailyWeatherResponse]:
+) -> Response:
     """
     List daily weather records with comprehensive filtering.
 
@@ -144,11 +203,12 @@ async def list_daily_weather_filtered(
     - Precipitation range filtering
     - Station and state filtering
     - Data availability filtering
-    - Flexible sorting and pagination
+    - Flexible sorting and page or keyset (cursor) pagination
     """
     try:
-        # Start with base queryset
-        queryset = DailyWeather.objects.select_related("station").all()
+        # Start with base queryset; responses only need the station_id FK
+        # column, so the station row is not joined into the SELECT
+        queryset = DailyWeather.objects.all()
 
         # Build comprehensive filters
         filters = FilterParams()
@@ -228,8 +288,19 @@ async def list_daily_weather_filtered(
                     detail=f"Minimum temperature ({query_params.min_temp}°C) cannot be greater than maximum temperature ({query_params.max_temp}°C)",
                 )
 
+            # Stored in tenths of a degree; scale the bounds so the predicate
+            # compares the raw column in SQL (sargable, index-friendly)
             filters.temperature_range = NumericRangeFilter(
-                min_value=query_params.min_temp, max_value=query_params.max_temp
+                min_value=(
+                    query_params.min_temp * 10
+                    if query_params.min_temp is not None
+                    else None
+                ),
+                max_value=(
+                    query_params.max_temp * 10
+                    if query_params.max_temp is not None
+                    else None
+                ),
             )
 
         # Precipitation filtering with validation
@@ -276,9 +347,18 @@ async def list_daily_weather_filtered(
                     f"Very high precipitation value: {query_params.max_precipitation}mm"
                 )
 
+            # Stored in tenths of a millimeter
             filters.precipitation_range = NumericRangeFilter(
-                min_value=query_params.min_precipitation,
-                max_value=query_params.max_precipitation,
+                min_value=(
+                    query_params.min_precipitation * 10
+                    if query_params.min_precipitation is not None
+                    else None
+                ),
+                max_value=(
+                    query_params.max_precipitation * 10
+                    if query_params.max_precipitation is not None
+                    else None
+                ),
             )
 
         # Location filtering
@@ -318,7 +398,9 @@ async def list_daily_weather_filtered(
             page=query_params.page, page_size=query_params.page_size
         )
 
-        paginated_result = paginate_queryset(queryset, pagination_params, request)
+        paginated_result = paginate_queryset(
+            queryset, pagination_params, request, cursor=query_params.cursor
+        )
 
         # Convert to response models
         weather_responses = [
@@ -336,7 +418,7 @@ async def list_daily_weather_filtered(
         if validation.get("warnings"):
             logger.warning(f"Filter warnings: {validation['warnings']}")
 
-        return result
+        return Response(content=_serialize_page(result), media_type="application/json")
 
     except Exception as e:
         logger.error(f"Error listing daily weather: {e}")
@@ -354,7 +436,7 @@ async def list_daily_weather_filtered(
 async def list_yearly_stats_filtered(
     request: Request,
     query_params: YearlyStatsQueryParams = Depends(create_yearly_stats_query_params),
-) -> PaginatedResponse[YearlyWeatherStatsResponse]:
+) -> Response:
     """
     List yearly weather statistics with advanced filtering.
 
@@ -365,10 +447,12 @@ async def list_yearly_stats_filtered(
     - Data completeness filtering
     - Station and state filtering
     - Multi-field sorting
+    - Page or keyset (cursor) pagination
     """
     try:
-        # Start with base queryset
-        queryset = YearlyWeatherStats.objects.select_related("station").all()
+        # Start with base queryset; responses only need the station_id FK
+        # column, so the station row is not joined into the SELECT
+        queryset = YearlyWeatherStats.objects.all()
 
         # Year filtering with validation
         if query_params.start_year or query_params.end_year or query_params.years:
@@ -472,18 +556,21 @@ async def list_yearly_stats_filtered(
             page=query_params.page, page_size=query_params.page_size
         )
 
-        paginated_result = paginate_queryset(queryset, pagination_params, request)
+        paginated_result = paginate_queryset(
+            queryset, pagination_params, request, cursor=query_params.cursor
+        )
 
         # Convert to response models
         stats_responses = [
             YearlyWeatherStatsResponse.from_orm(stat) for stat in paginated_result.items
         ]
 
-        return PaginatedResponse[YearlyWeatherStatsResponse](
+        result = PaginatedResponse[YearlyWeatherStatsResponse](
             items=stats_responses,
             pagination=paginated_result.pagination,
             links=paginated_result.links,
         )
+        return Response(content=_serialize_page(result), media_type="application/json")
 
     except Exception as e:
         logger.error(f"Error listing yearly stats: {e}")
@@ -495,13 +582,67 @@ async def list_yearly_stats_filtered(
         )
 
 
+def _serialize_page(result: PaginatedResponse[Any]) -> bytes:
+    """
+    Serialize an already-validated page of results to JSON.
+
+    Endpoints return these bytes in a plain Response, which skips FastAPI's
+    response_model pass of dumping, re-validating and re-encoding every item.
+    """
+    return orjson.dumps(result.model_dump(mode="json"))
+
+
+def _static_json_response(request: Request, payload: tuple[bytes, str]) -> Response:
+    """Serve a pre-serialized metadata body, honouring If-None-Match."""
+    body, etag = payload
+    if should_return_304(request, etag):
+        return create_304_response(etag)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={
+            "ETag": etag,
+            "Cache-Control": get_cache_control_header(CachePolicy.MEDIUM_CACHE),
+        },
+    )
+
+
+def _serialize_metadata(content: dict[str, Any]) -> tuple[bytes, str]:
+    """Serialize a metadata payload once and derive its ETag."""
+    body = orjson.dumps(content)
+    return body, generate_etag(body)
+
+
+@functools.cache
+def _sort_info_payload(model_type: str) -> tuple[bytes, str]:
+    """Build the sort-info body for a model type (derived from code only)."""
+    available_fields = get_available_sort_fields(model_type)
+
+    return _serialize_metadata(
+        {
+            "model_type": model_type,
+            "available_fields": available_fields,
+            "usage_examples": {
+                "single_field": "?sort_by=date&sort_order=desc",
+                "with_pagination": "?sort_by=date&sort_order=desc&page=1&page_size=50",
+                "note": "Use 'asc' for ascending or 'desc' for descending order",
+            },
+            "field_count": len(available_fields),
+        }
+    )
+
+
 @router.get("/sort-info/{model_type}")
-async def get_sort_information(model_type: str) -> dict[str, Any]:
+async def get_sort_information(model_type: str, request: Request) -> Response:
     """
     Get available sort fields and information for a model type.
 
+    The body only depends on code-declared sort fields, so it is serialized
+    once per model type and served with ETag/Cache-Control headers.
+
     Args:
         model_type: Type of model ('weather_station', 'daily_weather', 'yearly_stats')
+        request: FastAPI request object (for conditional requests)
 
     Returns:
         Information about available sort fields and usage
@@ -517,77 +658,77 @@ async def get_sort_information(model_type: str) -> dict[str, Any]:
             detail="Invalid model type. Allowed types: weather_station, daily_weather, yearly_stats, crop_yield",
         )
 
-    available_fields = get_available_sort_fields(model_type)
-
-    return {
-        "model_type": model_type,
-        "available_fields": available_fields,
-        "usage_examples": {
-            "single_field": "?sort_by=date&sort_order=desc",
-            "with_pagination": "?sort_by=date&sort_order=desc&page=1&page_size=50",
-            "note": "Use 'asc' for ascending or 'desc' for descending order",
-        },
-        "field_count": len(available_fields),
-    }
+    return _static_json_response(request, _sort_info_payload(model_type))
+
+
+@functools.cache
+def _filter_info_payload() -> tuple[bytes, str]:
+    """Build the filter-info body (derived from code only)."""
+    return _serialize_metadata(
+        {
+            "available_filters": {
+                "date_range": {
+                    "description": "Filter by date range",
+                    "parameters": ["start_date", "end_date"],
+                    "format": "YYYY-MM-DD",
+                    "example": "?start_date=2023-01-01&end_date=2023-12-31",
+                },
+                "year_month": {
+                    "description": "Filter by specific year or month",
+                    "parameters": ["year", "month"],
+                    "example": "?year=2023&month=6",
+                },
+                "temperature_range": {
+                    "description": "Filter by temperature range (Celsius)",
+                    "parameters": ["min_temp", "max_temp"],
+                    "example": "?min_temp=-10&max_temp=40",
+                },
+                "precipitation_range": {
+                    "description": "Filter by precipitation range (mm)",
+                    "parameters": ["min_precipitation", "max_precipitation"],
+                    "example": "?min_precipitation=0&max_precipitation=100",
+                },
+                "location": {
+                    "description": "Filter by state or station",
+                    "parameters": ["states", "station_ids"],
+                    "example": "?states=IL&states=IA&station_ids=USC00110072",
+                },
+                "data_availability": {
+                    "description": "Filter by data availability",
+                    "parameters": ["has_temperature", "has_precipitation"],
+                    "example": "?has_temperature=true&has_precipitation=true",
+                },
+                "text_search": {
+                    "description": "Search in text fields (stations only)",
+                    "parameters": ["search"],
+                    "example": "?search=Chicago",
+                },
+            },
+            "combination_examples": {
+                "comprehensive": "?start_date=2023-01-01&end_date=2023-12-31&states=IL&states=IA&min_temp=-10&max_temp=40&has_temperature=true&sort_by=date&sort_order=desc&page=1&page_size=50",
+                "simple_date": "?year=2023&sort_by=date&sort_order=desc",
+                "location_focus": "?states=IL&search=Chicago&sort_by=name",
+            },
+            "notes": [
+                "Multiple values for lists (states, station_ids) should be provided as separate parameters",
+                "Date formats must be YYYY-MM-DD",
+                "Temperature values are in Celsius",
+                "Precipitation values are in millimeters",
+                "Combine filters for more specific results",
+            ],
+        }
+    )
 
 
 @router.get("/filter-info")
-async def get_filter_information() -> dict[str, Any]:
+async def get_filter_information(request: Request) -> Response:
     """
     Get information about available filters and usage examples.
 
+    Args:
+        request: FastAPI request object (for conditional requests)
+
     Returns:
         Comprehensive filter documentation and examples
     """
-    return {
-        "available_filters": {
-            "date_range": {
-                "description": "Filter by date range",
-                "parameters": ["start_date", "end_date"],
-                "format": "YYYY-MM-DD",
-                "example": "?start_date=2023-01-01&end_date=2023-12-31",
-            },
-            "year_month": {
-                "description": "Filter by specific year or month",
-                "parameters": ["year", "month"],
-                "example": "?year=2023&month=6",
-            },
-            "temperature_range": {
-                "description": "Filter by temperature range (Celsius)",
-                "parameters": ["min_temp", "max_temp"],
-                "example": "?min_temp=-10&max_temp=40",
-            },
-            "precipitation_range": {
-                "description": "Filter by precipitation range (mm)",
-                "parameters": ["min_precipitation", "max_precipitation"],
-                "example": "?min_precipitation=0&max_precipitation=100",
-            },
-            "location": {
-                "description": "Filter by state or station",
-                "parameters": ["states", "station_ids"],
-                "example": "?states=IL&states=IA&station_ids=USC00110072",
-            },
-            "data_availability": {
-                "description": "Filter by data availability",
-                "parameters": ["has_temperature", "has_precipitation"],
-                "example": "?has_temperature=true&has_precipitation=true",
-            },
-            "text_search": {
-                "description": "Search in text fields (stations only)",
-                "parameters": ["search"],
-                "example": "?search=Chicago",
-            },
-        },
-        "combination_examples": {
-            "comprehensive": "?start_date=2023-01-01&end_date=2023-12-31&states=IL&states=IA&min_temp=-10&max_temp=40&has_temperature=true&sort_by=date&sort_order=desc&page=1&page_size=50",
-            "simple_date": "?year=2023&sort_by=date&sort_order=desc",
-            "location_focus": "?states=IL&search=Chicago&sort_by=name",
-        },
-        "notes": [
-            "Multiple values for lists (states, station_ids) should be provided as separate parameters",
-            "Date formats must be YYYY-MM-DD",
-            "Temperature values are in Celsius",
-            "Precipitation values are in millimeters",
-            "Combine filters for more specific results",
-        ],
-    }
+    return _static_json_response(request, _filter_info_payload())
@@ -18,6 +18,8 @@ from fastapi import APIRouter, HTTPException, Query, status
 from core_django.models.models import DailyWeather, WeatherStation, YearlyWeatherStats
 from core_django.utils.units import (
     calculate_data_completeness,
+    celsius_to_tenths,
+    millimeters_to_tenths,
     tenths_to_celsius,
     tenths_to_millimeters,
 )
@@ -1179,14 +1181,14 @@ async def _compute_temporal_breakdown(max_years: int) -> list[TemporalStats]:
             # Temperature stats for the year
             year_temp_data = year_data.filter(max_temp__isnull=False).aggregate(
                 mean_temp=Avg("max_temp"),
-                record_days=Count("date", filter=Q(max_temp__gt=tenths_to_celsius(35))),
+                record_days=Count("date", filter=Q(max_temp__gt=celsius_to_tenths(35))),
             )
 
             # Precipitation stats for the year
             year_precip_data = year_data.filter(precipitation__isnull=False).aggregate(
                 total_precip=Sum("precipitation"),
                 extreme_events=Count(
-                    "date", filter=Q(precipitation__gt=tenths_to_millimeters(25))
+                    "date", filter=Q(precipitation__gt=millimeters_to_tenths(25))
                 ),
             )
 
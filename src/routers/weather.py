@@ -67,9 +67,10 @@ def convert_daily_weather_to_response(
     daily_weather: DailyWeather,
 ) -> DailyWeatherResponse:
     """Convert Django model to Pydantic response model."""
+    # station_id is the FK column itself, so no station row has to be loaded
     return DailyWeatherResponse(
         id=daily_weather.id,
-        station_id=daily_weather.station.station_id,
+        station_id=daily_weather.station_id,
         date=daily_weather.date,
         max_temp=daily_weather.max_temp,
         min_temp=daily_weather.min_temp,
@@ -88,7 +89,7 @@ def convert_yearly_stats_to_response(
     """Convert Django yearly stats model to Pydantic response model."""
     return YearlyWeatherStatsResponse(
         id=yearly_stats.id,
-        station_id=yearly_stats.station.station_id,
+        station_id=yearly_stats.station_id,
         year=yearly_stats.year,
         avg_max_temp=yearly_stats.avg_max_temp,
         avg_min_temp=yearly_stats.avg_min_temp,
@@ -334,7 +335,7 @@ async def list_daily_weather(
     List daily weather records with pagination and filtering.
     """
     try:
-        queryset = DailyWeather.objects.select_related("station")
+        queryset = DailyWeather.objects.all()
 
         # Apply filters
         if station_id:
@@ -451,9 +452,7 @@ async def get_daily_weather(record_id: int):
     Get a specific daily weather record by ID.
     """
     try:
-        daily_weather = get_object_or_404(
-            DailyWeather.objects.select_related("station"), id=record_id
-        )
+        daily_weather = get_object_or_404(DailyWeather, id=record_id)
         return convert_daily_weather_to_response(daily_weather)
 
     except Exception as e:
@@ -470,9 +469,7 @@ async def update_daily_weather(record_id: int, weather_data: DailyWeatherUpdate)
     Update an existing daily weather record.
     """
     try:
-        daily_weather = get_object_or_404(
-            DailyWeather.objects.select_related("station"), id=record_id
-        )
+        daily_weather = get_object_or_404(DailyWeather, id=record_id)
 
         # Update fields
         update_data = weather_data.dict(exclude_unset=True)
@@ -505,7 +502,7 @@ async def delete_daily_weather(record_id: int):
     try:
         daily_weather = get_object_or_404(DailyWeather, id=record_id)
 
-        station_id = daily_weather.station.station_id
+        station_id = daily_weather.station_id
         date = daily_weather.date
 
         daily_weather.delete()
@@ -553,7 +550,7 @@ async def list_yearly_stats(
     List yearly weather statistics with pagination and filtering.
     """
     try:
-        queryset = YearlyWeatherStats.objects.select_related("station")
+        queryset = YearlyWeatherStats.objects.all()
 
         # Apply filters
         if station_id:
@@ -610,9 +607,7 @@ async def get_yearly_stats(stat_id: int):
     Get a specific yearly weather statistics record by ID.
     """
     try:
-        yearly_stats = get_object_or_404(
-            YearlyWeatherStats.objects.select_related("station"), id=stat_id
-        )
+        yearly_stats = get_object_or_404(YearlyWeatherStats, id=stat_id)
         return convert_yearly_stats_to_response(yearly_stats)
 
     except Exception as e:
@@ -6,14 +6,17 @@ This module provides utilities for HTTP caching including:
 - Cache control headers for different endpoint types
 - Conditional request handling
 - Cache policy configuration
+- Tagged response caching backed by the Django cache
 """
 
 import hashlib
 import json
+import uuid
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from django.core.cache import cache
 from fastapi import Request, Response
 
 
@@ -249,8 +252,13 @@ def get_cache_key(request: Request) -> str:
     Returns:
         Cache key string
     """
-    # Create cache key from path and query parameters
-    key_parts = [request.url.path, str(sorted(request.query_params.items()))]
+    # Create cache key from URL and query parameters. Repeated parameters
+    # (e.g. ``state=TX&state=CA``) are all kept, and the host is included
+    # because pagination links embed the request's base URL.
+    key_parts = [
+        str(request.url.replace(query="")),
+        str(sorted(request.query_params.multi_items())),
+    ]
 
     # Add relevant headers that affect caching
     accept_encoding = request.headers.get("Accept-Encoding", "")
@@ -259,3 +267,52 @@ def get_cache_key(request: Request) -> str:
 
     cache_key = "|".join(key_parts)
     return hashlib.md5(cache_key.encode(), usedforsecurity=False).hexdigest()
+
+
+# Tag of the cached v2 station listings. Defined here rather than in the
+# router so that data loaders running outside the API can invalidate it.
+STATIONS_CACHE_TAG = "weather-stations"
+
+
+def _cache_tag_key(tag: str) -> str:
+    return f"cache-tag:{tag}"
+
+
+def get_cache_tag_version(tag: str) -> str:
+    """
+    Get the current version token for a cache tag.
+
+    Entries cached under a tag embed this token in their key, so replacing
+    the token invalidates all of them at once without having to find them.
+
+    Args:
+        tag: Cache tag name
+
+    Returns:
+        Current version token for the tag
+    """
+    return cache.get_or_set(_cache_tag_key(tag), lambda: uuid.uuid4().hex, None)
+
+
+def invalidate_cache_tag(tag: str) -> None:
+    """
+    Invalidate every cached entry stored under a tag.
+
+    Args:
+        tag: Cache tag name
+    """
+    cache.set(_cache_tag_key(tag), uuid.uuid4().hex, None)
+
+
+def get_tagged_cache_key(tag: str, request: Request) -> str:
+    """
+    Generate a cache key for a request, scoped to the current tag version.
+
+    Args:
+        tag: Cache tag name
+        request: FastAPI request object
+
+    Returns:
+        Cache key string
+    """
+    return f"{tag}:{get_cache_tag_version(tag)}:{get_cache_key(request)}"
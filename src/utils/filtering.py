@@ -359,23 +359,38 @@ class StateFilter(BaseModel):
                 raise ValueError("State codes must be uppercase")
         return v
 
+    @staticmethod
+    def _state_lookup(field_name: str, states: list[str]) -> dict[str, Any]:
+        """
+        Build a single lookup for a list of state codes.
+
+        Duplicates are dropped and the codes sorted so repeated requests bind
+        the same parameter list; one state becomes a plain equality.
+        """
+        unique_states = sorted(set(states))
+        if len(unique_states) == 1:
+            return {field_name: unique_states[0]}
+        return {f"{field_name}__in": unique_states}
+
     def apply_to_queryset(
         self, queryset: QuerySet, field_name: str = "state"
     ) -> QuerySet:
         """Apply state filter to queryset."""
         if self.states:
-            queryset = queryset.filter(**{f"{field_name}__in": self.states})
+            queryset = queryset.filter(**self._state_lookup(field_name, self.states))
         if self.exclude_states:
-            queryset = queryset.exclude(**{f"{field_name}__in": self.exclude_states})
+            queryset = queryset.exclude(
+                **self._state_lookup(field_name, self.exclude_states)
+            )
         return queryset
 
     def to_q_object(self, field_name: str = "state") -> Q:
         """Convert to Django Q object."""
         q = Q()
         if self.states:
-            q &= Q(**{f"{field_name}__in": self.states})
+            q &= Q(**self._state_lookup(field_name, self.states))
         if self.exclude_states:
-            q &= ~Q(**{f"{field_name}__in": self.exclude_states})
+            q &= ~Q(**self._state_lookup(field_name, self.exclude_states))
         return q
 
     class Config:
@@ -441,9 +456,8 @@ def create_numeric_range_filter(
 
 
 def create_text_search_filter(
-    search: str | None = Query(
-        None, min_length=1, max_length=200, description="Search term"
-    ),
+    search: str
+    | None = Query(None, min_length=1, max_length=200, description="Search term"),
     case_sensitive: bool = Query(False, description="Case sensitive search"),
     exact_match: bool = Query(False, description="Exact match search"),
 ) -> TextSearchFilter:
@@ -541,22 +555,44 @@ def apply_filters(
         else:
             queryset = queryset.filter(**{f"{precip_field}__isnull": True})
 
-    if filters.year is not None:
-        if "year" in context_fields:
-            # For yearly stats model
-            queryset = queryset.filter(**{context_fields["year"]: filters.year})
-        else:
-            # For date-based models
-            date_field = context_fields.get("date", "date")
-            queryset = queryset.filter(**{f"{date_field}__year": filters.year})
-
-    if filters.month is not None:
-        date_field = context_fields.get("date", "date")
-        queryset = queryset.filter(**{f"{date_field}__month": filters.month})
+    if filters.year is not None or filters.month is not None:
+        queryset = queryset.filter(_calendar_q(filters, context_fields))
 
     return queryset
 
 
+def _calendar_q(filters: FilterParams, context_fields: dict[str, Any]) -> Q:
+    """
+    Build the year/month filter as a plain range on the date column.
+
+    Django already turns ``__year`` into a BETWEEN on the date; a year plus
+    month becomes a half-open date range as well, so date indexes stay
+    usable instead of evaluating EXTRACT(MONTH ...) on every row.
+    """
+    if "year" in context_fields:
+        # For yearly stats model
+        if filters.year is None:
+            return Q()
+        return Q(**{context_fields["year"]: filters.year})
+
+    # For date-based models
+    date_field = context_fields.get("date", "date")
+    if filters.year is not None and filters.month is not None:
+        month_start = date(filters.year, filters.month, 1)
+        next_month_start = date(
+            filters.year + filters.month // 12, filters.month % 12 + 1, 1
+        )
+        return Q(
+            **{
+                f"{date_field}__gte": month_start,
+                f"{date_field}__lt": next_month_start,
+            }
+        )
+    if filters.year is not None:
+        return Q(**{f"{date_field}__year": filters.year})
+    return Q(**{f"{date_field}__month": filters.month})
+
+
 def build_filter_q(filters: FilterParams, model_context: str = "daily_weather") -> Q:
     """
     Build a Django Q object from filter parameters.
@@ -629,16 +665,8 @@ def build_filter_q(filters: FilterParams, model_context: str = "daily_weather")
         else:
             combined_q &= Q(**{f"{precip_field}__isnull": True})
 
-    if filters.year is not None:
-        if "year" in context_fields:
-            combined_q &= Q(**{context_fields["year"]: filters.year})
-        else:
-            date_field = context_fields.get("date", "date")
-            combined_q &= Q(**{f"{date_field}__year": filters.year})
-
-    if filters.month is not None:
-        date_field = context_fields.get("date", "date")
-        combined_q &= Q(**{f"{date_field}__month": filters.month})
+    if filters.year is not None or filters.month is not None:
+        combined_q &= _calendar_q(filters, context_fields)
 
     return combined_q
 
@@ -668,10 +696,11 @@ def validate_filter_compatibility(filters: FilterParams) -> dict[str, Any]:
         and filters.temperature_range.min_value is not None
         and filters.temperature_range.max_value is not None
     ):
+        # Bounds are in the stored unit, tenths of a degree: narrower than 1°C
         temp_range = (
             filters.temperature_range.max_value - filters.temperature_range.min_value
         )
-        if temp_range < 1:
+        if temp_range < 10:
             warnings.append("Very narrow temperature range may return few results")
 
     # Check for logical impossibilities
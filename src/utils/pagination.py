@@ -4,6 +4,7 @@ Pagination utilities for the Weather Data Engineering API.
 This module provides reusable pagination functionality including:
 - Page-based pagination (traditional page numbers)
 - Cursor-based pagination (for large datasets)
+- Keyset pagination on the active sort field for ordered querysets
 - Pagination metadata and response wrappers
 """
 
@@ -12,9 +13,9 @@ import logging
 from typing import Any, Generic, TypeVar
 from urllib.parse import urlencode
 
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
-from django.db.models import QuerySet
-from fastapi import Query, Request
+from django.db import connections
+from django.db.models import Count, Q, QuerySet, Window
+from fastapi import HTTPException, Query, Request, status
 from pydantic import BaseModel, Field, validator
 
 logger = logging.getLogger(__name__)
@@ -32,38 +33,30 @@ class PaginationParams(BaseModel):
         default=20, ge=1, le=1000, description="Number of items per page", example=20
     )
 
-    @validator("page")
-    def validate_page(cls, v):
-        """Validate page number."""
-        if v < 1:
-            raise ValueError("Page number must be at least 1")
-        if v > 10000:
-            raise ValueError("Page number cannot exceed 10000")
-        return v
-
-    @validator("page_size")
-    def validate_page_size(cls, v):
-        """Validate page size."""
-        if v < 1:
-            raise ValueError("Page size must be at least 1")
-        if v > 1000:
-            raise ValueError("Page size cannot exceed 1000")
-        return v
-
 
 class PaginationMeta(BaseModel):
     """Pagination metadata for page-based pagination."""
 
     page: int = Field(..., description="Current page number")
     page_size: int = Field(..., description="Number of items per page")
-    total_items: int = Field(..., description="Total number of items")
-    total_pages: int = Field(..., description="Total number of pages")
+    total_items: int | None = Field(
+        ..., description="Total number of items (null for cursor pages)"
+    )
+    total_pages: int | None = Field(
+        ..., description="Total number of pages (null for cursor pages)"
+    )
     has_next: bool = Field(..., description="Whether there is a next page")
     has_previous: bool = Field(..., description="Whether there is a previous page")
     next_page: int | None = Field(None, description="Next page number if available")
     previous_page: int | None = Field(
         None, description="Previous page number if available"
     )
+    next_cursor: str | None = Field(
+        None, description="Keyset cursor for the next page if available"
+    )
+    previous_cursor: str | None = Field(
+        None, description="Keyset cursor for the previous page if available"
+    )
 
     class Config:
         json_schema_extra = {
@@ -76,6 +69,8 @@ class PaginationMeta(BaseModel):
                 "has_previous": True,
                 "next_page": 3,
                 "previous_page": 1,
+                "next_cursor": "eyJkIjoibmV4dCIsImYiOiJkYXRlIiwicGsiOjQwLCJ2IjoiMjAxMC0wMS0xMCJ9",  # pragma: allowlist secret
+                "previous_cursor": "eyJkIjoicHJldiIsImYiOiJkYXRlIiwicGsiOjIxLCJ2IjoiMjAxMC0wMS0yOSJ9",  # pragma: allowlist secret
             }
         }
 
@@ -102,6 +97,8 @@ class PaginatedResponse(BaseModel, Generic[T]):
                     "has_previous": False,
                     "next_page": 2,
                     "previous_page": None,
+                    "next_cursor": "eyJkIjoibmV4dCIsImYiOiJkYXRlIiwicGsiOjQwLCJ2IjoiMjAxMC0wMS0xMCJ9",  # pragma: allowlist secret
+                    "previous_cursor": None,
                 },
                 "links": {
                     "self": "/api/endpoint?page=1&page_size=20",
@@ -190,46 +187,79 @@ def paginate_queryset(
     queryset: QuerySet,
     pagination: PaginationParams,
     request: Request | None = None,
+    cursor: str | None = None,
 ) -> PaginatedResponse[Any]:
     """
-    Paginate a Django QuerySet using page-based pagination.
+    Paginate a Django QuerySet using page-based or keyset pagination.
+
+    Ordered querysets keep their ordering with the primary key appended as a
+    tiebreaker, so pages are stable. Querysets ordered by a single field
+    also emit keyset cursors alongside page numbers; when a cursor is
+    supplied the page is fetched with a seek predicate instead of OFFSET,
+    so its cost does not grow with the position in the result set, and no
+    total count is computed. Page-number requests fetch the total together with
+    the page rows through a window aggregate instead of a separate COUNT.
 
     Args:
         queryset: Django QuerySet to paginate
         pagination: Pagination parameters
         request: FastAPI request object (for link generation)
+        cursor: Keyset cursor from a previous response's pagination metadata
 
     Returns:
         PaginatedResponse with items and pagination metadata
     """
-    try:
-        paginator = Paginator(queryset, pagination.page_size)
-        page_obj = paginator.get_page(pagination.page)
-
-        # Handle invalid page numbers gracefully
-        if pagination.page > paginator.num_pages and paginator.num_pages > 0:
-            page_obj = paginator.get_page(paginator.num_pages)
-            actual_page = paginator.num_pages
-        else:
-            actual_page = pagination.page
+    queryset = _with_pk_tiebreaker(queryset)
+    keyset = _get_keyset_ordering(queryset)
+
+    if cursor:
+        if not keyset:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor pagination requires ordering by a single field",
+            )
+        return _keyset_paginate(queryset, pagination, keyset, cursor, request)
+
+    items, total_items = _fetch_page_with_total(
+        queryset, pagination.page, pagination.page_size
+    )
+    # Like Django's Paginator, an empty result still has one (empty) page
+    total_pages = max(
+        (total_items + pagination.page_size - 1) // pagination.page_size, 1
+    )
 
-    except (PageNotAnInteger, EmptyPage):
-        # Return empty result for invalid pages
-        page_obj = paginator.get_page(1)
-        actual_page = 1
+    # Out-of-range pages fall back to the last page
+    actual_page = pagination.page
+    if actual_page > total_pages:
+        actual_page = total_pages
+        if total_items:
+            items, total_items = _fetch_page_with_total(
+                queryset, actual_page, pagination.page_size
+            )
+
+    has_next = actual_page < total_pages
+    has_previous = actual_page > 1
+
+    # Cursors let clients continue from this page without OFFSET scans
+    next_cursor = previous_cursor = None
+    if keyset and items:
+        if has_next:
+            next_cursor = _encode_keyset_cursor(items[-1], keyset, "next")
+        if has_previous:
+            previous_cursor = _encode_keyset_cursor(items[0], keyset, "prev")
 
     # Create pagination metadata
     pagination_meta = PaginationMeta(
         page=actual_page,
         page_size=pagination.page_size,
-        total_items=paginator.count,
-        total_pages=paginator.num_pages,
-        has_next=page_obj.has_next(),
-        has_previous=page_obj.has_previous(),
-        next_page=page_obj.next_page_number() if page_obj.has_next() else None,
-        previous_page=page_obj.previous_page_number()
-        if page_obj.has_previous()
-        else None,
+        total_items=total_items,
+        total_pages=total_pages,
+        has_next=has_next,
+        has_previous=has_previous,
+        next_page=actual_page + 1 if has_next else None,
+        previous_page=actual_page - 1 if has_previous else None,
+        next_cursor=next_cursor,
+        previous_cursor=previous_cursor,
     )
 
     # Generate navigation links if request is provided
@@ -260,11 +290,256 @@ def paginate_queryset(
         query_params.update({"page": 1})
         links["first"] = f"{base_url}?{urlencode(query_params)}"
 
-        query_params.update({"page": pagination_meta.total_pages})
+        query_params.update({"page": max(total_pages, 1)})
         links["last"] = f"{base_url}?{urlencode(query_params)}"
 
     return PaginatedResponse(
-        items=list(page_obj.object_list),
+        items=items,
+        pagination=pagination_meta,
+        links=links,
+    )
+
+
+def _fetch_page_with_total(
+    queryset: QuerySet, page: int, page_size: int
+) -> tuple[list[Any], int]:
+    """
+    Fetch one page of rows and the total row count in a single query.
+
+    ``COUNT(*) OVER ()`` is evaluated before LIMIT/OFFSET, so every returned
+    row carries the size of the whole filtered set. Only an empty page needs
+    a separate COUNT. Window functions run before DISTINCT, so DISTINCT
+    querysets keep the plain slice-plus-COUNT path.
+    """
+    offset = (page - 1) * page_size
+    if queryset.query.distinct:
+        return list(queryset[offset : offset + page_size]), queryset.count()
+
+    items = list(
+        queryset.annotate(pagination_total=Window(expression=Count("pk")))[
+            offset : offset + page_size
+        ]
+    )
+    if items:
+        return items, items[0].pagination_total
+    return items, queryset.count()
+
+
+def _with_pk_tiebreaker(queryset: QuerySet) -> QuerySet:
+    """
+    Append the primary key to an ordered queryset's ordering.
+
+    Rows with equal sort values then have a fixed order, so they can't
+    repeat or go missing between pages. The key follows the direction of
+    the first sort field, which is what the keyset predicate expects.
+    """
+    ordering = queryset.query.order_by
+    if not ordering:
+        return queryset
+
+    pk_name = queryset.model._meta.pk.name
+    names = {entry.lstrip("-") for entry in ordering if isinstance(entry, str)}
+    if names & {pk_name, "pk"}:
+        return queryset
+
+    descending = isinstance(ordering[0], str) and ordering[0].startswith("-")
+    return queryset.order_by(*ordering, f"-{pk_name}" if descending else pk_name)
+
+
+def _get_keyset_ordering(
+    queryset: QuerySet,
+) -> tuple[str, bool, str, bool] | None:
+    """
+    Return (sort field, descending, pk name, nulls last) for a keyset walk.
+
+    Only an ordering on a single field, optionally followed by the primary
+    key in the same direction, can be walked with a cursor. NULLs stay
+    where the database puts them for that direction, so the walk visits
+    rows in the same order as page-number requests.
+    """
+    ordering = queryset.query.order_by
+    if not ordering or not isinstance(ordering[0], str):
+        return None
+
+    primary = ordering[0]
+    field, descending = primary.lstrip("-"), primary.startswith("-")
+    pk_name = queryset.model._meta.pk.name
+    pk_order = f"-{pk_name}" if descending else pk_name
+    if len(ordering) > 2 or (len(ordering) == 2 and ordering[1] != pk_order):
+        return None
+
+    nulls_largest = connections[queryset.db].features.nulls_order_largest
+    return field, descending, pk_name, nulls_largest != descending
+
+
+def _order_for_keyset(
+    queryset: QuerySet, field: str, descending: bool, pk_name: str
+) -> QuerySet:
+    """Order by the sort field, then the primary key, in one direction."""
+    sign = "-" if descending else ""
+    if field == pk_name:
+        return queryset.order_by(f"{sign}{pk_name}")
+    return queryset.order_by(f"{sign}{field}", f"{sign}{pk_name}")
+
+
+def _resolve_field_value(obj: Any, field: str) -> Any:
+    """Resolve a Django lookup path such as ``station__state`` on an instance."""
+    for attr in field.split("__"):
+        if obj is None:
+            return None
+        obj = getattr(obj, attr)
+    return obj
+
+
+def _encode_keyset_cursor(
+    obj: Any, keyset: tuple[str, bool, str, bool], direction: str
+) -> str:
+    """Encode the sort key and primary key of a boundary row."""
+    field, _descending, pk_name, _nulls_last = keyset
+    return encode_cursor(
+        {
+            "f": field,
+            "v": _resolve_field_value(obj, field),
+            "pk": getattr(obj, pk_name),
+            "d": direction,
+        }
+    )
+
+
+def _keyset_predicate(
+    field: str,
+    descending: bool,
+    pk_name: str,
+    nulls_last: bool,
+    value: Any,
+    pk_value: Any,
+    forward: bool,
+) -> Q:
+    """
+    Build the seek predicate for rows after (or before) a cursor position.
+
+    Rows are ordered by (field, pk) in the requested direction, with NULL
+    sort values after the others if ``nulls_last`` and before them if not.
+    """
+    after = "lt" if descending else "gt"
+    before = "gt" if descending else "lt"
+    compare = after if forward else before
+
+    if field == pk_name:
+        return Q(**{f"{pk_name}__{compare}": pk_value})
+
+    # Whether the NULL group lies ahead in the direction being walked
+    nulls_ahead = forward == nulls_last
+
+    if value is None:
+        null_rows = Q(**{f"{field}__isnull": True, f"{pk_name}__{compare}": pk_value})
+        if nulls_ahead:
+            return null_rows
+        return null_rows | Q(**{f"{field}__isnull": False})
+
+    predicate = Q(**{f"{field}__{compare}": value}) | Q(
+        **{field: value, f"{pk_name}__{compare}": pk_value}
+    )
+    if nulls_ahead:
+        predicate |= Q(**{f"{field}__isnull": True})
+    return predicate
+
+
+def _keyset_paginate(
+    queryset: QuerySet,
+    pagination: PaginationParams,
+    keyset: tuple[str, bool, str, bool],
+    cursor: str,
+    request: Request | None,
+) -> PaginatedResponse[Any]:
+    """Fetch one page relative to a keyset cursor."""
+    field, descending, pk_name, nulls_last = keyset
+
+    cursor_data = decode_cursor(cursor)
+    if (
+        not isinstance(cursor_data, dict)
+        or cursor_data.get("f") != field
+        or "pk" not in cursor_data
+        or cursor_data.get("d") not in ("next", "prev")
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor for the requested sort order",
+        )
+
+    forward = cursor_data["d"] == "next"
+
+    page_queryset = queryset.filter(
+        _keyset_predicate(
+            field,
+            descending,
+            pk_name,
+            nulls_last,
+            cursor_data.get("v"),
+            cursor_data["pk"],
+            forward,
+        )
+    )
+    if not forward:
+        # Walk backwards from the cursor, then restore the page's order
+        page_queryset = _order_for_keyset(page_queryset, field, not descending, pk_name)
+
+    # Fetch one extra row to learn whether the walk can continue
+    items = list(page_queryset[: pagination.page_size + 1])
+    has_more = len(items) > pagination.page_size
+    items = items[: pagination.page_size]
+    if not forward:
+        items.reverse()
+
+    # A cursor was followed, so the rows on the other side of it exist
+    has_next = has_more if forward else True
+    has_previous = True if forward else has_more
+
+    next_cursor = (
+        _encode_keyset_cursor(items[-1], keyset, "next") if has_next and items else None
+    )
+    previous_cursor = (
+        _encode_keyset_cursor(items[0], keyset, "prev")
+        if has_previous and items
+        else None
+    )
+
+    # Seeking never scans the skipped rows, so no total is computed
+    pagination_meta = PaginationMeta(
+        page=pagination.page,
+        page_size=pagination.page_size,
+        total_items=None,
+        total_pages=None,
+        has_next=has_next,
+        has_previous=has_previous,
+        next_cursor=next_cursor,
+        previous_cursor=previous_cursor,
+    )
+
+    # Generate navigation links if request is provided
+    links = {}
+    if request:
+        base_url = str(request.url).split("?")[0]
+        query_params = dict(request.query_params)
+        query_params.pop("page", None)
+
+        links["self"] = str(request.url)
+
+        query_params.update({"page_size": pagination.page_size})
+        for name, link_cursor in (("next", next_cursor), ("previous", previous_cursor)):
+            if link_cursor:
+                query_params["cursor"] = link_cursor
+                links[name] = f"{base_url}?{urlencode(query_params)}"
+            else:
+                links[name] = None
+
+        query_params.pop("cursor", None)
+        query_params.update({"page": 1})
+        links["first"] = f"{base_url}?{urlencode(query_params)}"
+        links["last"] = None
+
+    return PaginatedResponse(
+        items=items,
         pagination=pagination_meta,
         links=links,
     )
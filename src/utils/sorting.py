@@ -8,6 +8,7 @@ This module provides reusable sorting functionality including:
 """
 
 import logging
+from enum import Enum
 from typing import Any
 
 from django.db.models import QuerySet
@@ -156,6 +157,62 @@ DEFAULT_SORT_FIELDS = {
 }
 
 
+# Endpoint-level sort field types: unknown fields are rejected while the
+# request is parsed, and the allowed values are published in the OpenAPI schema.
+# Members mirror the keys of the matching ALLOWED_SORT_FIELDS context.
+class WeatherStationSortField(str, Enum):
+    """Sort fields allowed for weather stations."""
+
+    id = "id"
+    station_id = "station_id"
+    name = "name"
+    state = "state"
+    latitude = "latitude"
+    longitude = "longitude"
+    elevation = "elevation"
+    created_at = "created_at"
+    updated_at = "updated_at"
+
+
+class DailyWeatherSortField(str, Enum):
+    """Sort fields allowed for daily weather records."""
+
+    id = "id"
+    date = "date"
+    station = "station"
+    station_id = "station_id"
+    station_name = "station_name"
+    state = "state"
+    max_temp = "max_temp"
+    min_temp = "min_temp"
+    temperature = "temperature"
+    precipitation = "precipitation"
+    created_at = "created_at"
+    updated_at = "updated_at"
+
+
+class YearlyStatsSortField(str, Enum):
+    """Sort fields allowed for yearly weather statistics."""
+
+    id = "id"
+    year = "year"
+    station = "station"
+    station_id = "station_id"
+    station_name = "station_name"
+    state = "state"
+    avg_max_temp = "avg_max_temp"
+    avg_min_temp = "avg_min_temp"
+    max_temp = "max_temp"
+    min_temp = "min_temp"
+    total_precipitation = "total_precipitation"
+    avg_precipitation = "avg_precipitation"
+    max_precipitation = "max_precipitation"
+    total_records = "total_records"
+    completeness = "completeness"
+    created_at = "created_at"
+    updated_at = "updated_at"
+
+
 def create_sort_params(
     sort_by: str = Query("id", description="Field to sort by"),
     sort_order: str = Query("asc", pattern="^(asc|desc)$", description="Sort order"),
@@ -11,6 +11,7 @@ This module provides:
 import asyncio
 import os
 import sys
+from contextlib import AsyncExitStack
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -18,7 +19,7 @@ import django
 import pytest
 import pytest_asyncio
 from asgi_lifespan import LifespanManager
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
 
 # Add project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -44,7 +45,13 @@ from src.main import app  # noqa: E402
 
 @pytest.fixture(scope="session")
 def event_loop():
-    """Create an instance of the default event loop for the test session."""
+    """
+    Create an instance of the default event loop for the test session.
+
+    Every async test and fixture runs on this one loop, so selector setup
+    happens once per session and the session-scoped ``client`` below stays
+    bound to the loop it was created on.
+    """
     loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
     loop.close()
@@ -122,12 +129,76 @@ def django_db_setup(django_db_setup, django_db_blocker):
             )
 
 
-@pytest_asyncio.fixture
-async def client() -> AsyncClient:
-    """Create an async HTTP client for testing."""
-    async with LifespanManager(app):
-        async with AsyncClient(app=app, base_url="http://test") as ac:
-            yield ac
+# System endpoints requested once before any test, to warm the app up
+WARMUP_URLS = ("/", "/health", "/info")
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client(django_db_setup, django_db_blocker) -> AsyncClient:
+    """
+    Create an async HTTP client for testing.
+
+    Every request made during the session goes through this one client and
+    its in-process ASGI transport, so the app's lifespan startup runs once
+    and concurrent requests issued with ``asyncio.gather`` share it instead
+    of paying per-request client setup. Database isolation between tests is
+    still provided per test by pytest-django.
+
+    The system endpoints are requested once up front, so first-call work in
+    the routing and middleware stack and the first database connection
+    aren't charged to whichever timing test runs first.
+
+    The lifespan startup and the warm-up requests touch the database, and
+    session fixtures run outside any test's database access, so access is
+    unblocked for that setup alone.
+    """
+    async with AsyncExitStack() as stack:
+        with django_db_blocker.unblock():
+            await stack.enter_async_context(LifespanManager(app))
+            transport = ASGITransport(app=app)
+            ac = await stack.enter_async_context(
+                AsyncClient(transport=transport, base_url="http://test")
+            )
+            await asyncio.gather(*(ac.get(url) for url in WARMUP_URLS))
+        yield ac
+
+
+async def _first_item_field(
+    client: AsyncClient, django_db_blocker, url: str, field: str
+) -> Any:
+    """Return field of the first item the paginated url lists, or None."""
+    with django_db_blocker.unblock():
+        response = await client.get(url, params={"page_size": 1})
+    if response.status_code != 200:
+        return None
+    items = response.json()["items"]
+    return items[0][field] if items else None
+
+
+@pytest_asyncio.fixture(scope="session")
+async def sample_station_id(client, django_db_blocker) -> str | None:
+    """
+    Provide the ID of a station the API lists, or None if it lists none.
+
+    Looked up once per session for tests that need a real station to drive
+    follow-up requests.
+    """
+    return await _first_item_field(
+        client, django_db_blocker, "/api/v2/weather-stations", "station_id"
+    )
+
+
+@pytest_asyncio.fixture(scope="session")
+async def sample_year(client, django_db_blocker) -> int | None:
+    """
+    Provide a year the API has yearly statistics for, or None if it has none.
+
+    Looked up once per session for tests that need a real year to drive
+    follow-up requests.
+    """
+    return await _first_item_field(
+        client, django_db_blocker, "/api/v2/yearly-stats", "year"
+    )
 
 
 @pytest.fixture
@@ -465,3 +536,7 @@ def pytest_configure(config):
         "markers", "documentation: marks tests as documentation tests"
     )
     config.addinivalue_line("markers", "performance: marks tests as performance tests")
+    # Registered here too so --strict-markers passes without pytest-xdist
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests sharing a name on one xdist worker"
+    )
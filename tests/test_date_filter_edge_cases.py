@@ -126,8 +126,9 @@ class TestDateFilterEdgeCases(BaseAPITest):
         # Min > Max temperature
         response = self.client.get("/api/v2/daily-weather?min_temp=30&max_temp=20")
         assert response.status_code == 400
-        assert "Minimum temperature" in response.json()["detail"]
-        assert "cannot be greater than maximum temperature" in response.json()["detail"]
+        detail = response.json()["detail"]
+        assert "Minimum temperature" in detail
+        assert "cannot be greater than maximum temperature" in detail
 
     def test_api_invalid_precipitation_ranges(self):
         """Test API endpoints with invalid precipitation ranges."""
@@ -141,10 +142,9 @@ class TestDateFilterEdgeCases(BaseAPITest):
             "/api/v2/daily-weather?min_precipitation=100&max_precipitation=50"
         )
         assert response.status_code == 400
-        assert "Minimum precipitation" in response.json()["detail"]
-        assert (
-            "cannot be greater than maximum precipitation" in response.json()["detail"]
-        )
+        detail = response.json()["detail"]
+        assert "Minimum precipitation" in detail
+        assert "cannot be greater than maximum precipitation" in detail
 
     def test_api_invalid_yearly_stats_filters(self):
         """Test yearly stats endpoint with invalid filters."""
@@ -10,12 +10,25 @@ This module tests:
 - Documentation status and health
 """
 
-import json
+import asyncio
 
 import pytest
 
 from tests.test_base import IntegrationTestBase
 
+HTTP_METHODS = frozenset({"GET", "POST", "PUT", "DELETE", "PATCH"})
+ABSOLUTE_URL_PREFIXES = ("http://", "https://")
+EXAMPLE_REQUIRED_FIELDS = ("title", "description", "method", "url", "curl_example")
+GUIDE_REQUIRED_FIELDS = (
+    "title",
+    "description",
+    "language",
+    "code_example",
+    "prerequisites",
+    "steps",
+)
+OPENAPI_OPERATIONS = frozenset({"get", "post", "put", "delete", "patch"})
+
 
 @pytest.mark.integration
 @pytest.mark.documentation
@@ -138,7 +151,7 @@ class TestAPIInformationEndpoints(IntegrationTestBase):
 
         # Validate documentation links
         docs = data["documentation"]
-        for _doc_type, url in docs.items():
+        for url in docs.values():
             assert url.startswith("/"), f"Documentation URL should be absolute: {url}"
 
         # Validate endpoints count
@@ -162,7 +175,7 @@ class TestAPIInformationEndpoints(IntegrationTestBase):
             self.assert_required_fields(endpoint_info, required_fields)
 
             assert isinstance(endpoint_info["path"], str)
-            assert endpoint_info["method"] in ["GET", "POST", "PUT", "DELETE", "PATCH"]
+            assert endpoint_info["method"] in HTTP_METHODS
 
     @pytest.mark.asyncio
     async def test_api_examples(self):
@@ -176,18 +189,18 @@ class TestAPIInformationEndpoints(IntegrationTestBase):
         assert isinstance(data, list)
         assert len(data) > 0, "Should have API examples"
 
+        assert_required_fields = self.assert_required_fields
         for example in data:
-            required_fields = ["title", "description", "method", "url", "curl_example"]
-            self.assert_required_fields(example, required_fields)
+            assert_required_fields(example, EXAMPLE_REQUIRED_FIELDS)
 
             # Validate example structure
-            assert isinstance(example["title"], str) and len(example["title"]) > 0
-            assert (
-                isinstance(example["description"], str)
-                and len(example["description"]) > 0
-            )
-            assert example["method"] in ["GET", "POST", "PUT", "DELETE", "PATCH"]
-            assert example["url"].startswith("http"), "Example URL should be complete"
+            title, description = example["title"], example["description"]
+            assert isinstance(title, str) and title
+            assert isinstance(description, str) and description
+            assert example["method"] in HTTP_METHODS
+            assert example["url"].startswith(
+                ABSOLUTE_URL_PREFIXES
+            ), "Example URL should be complete"
             assert "curl" in example["curl_example"], "Should contain curl command"
 
     @pytest.mark.asyncio
@@ -211,16 +224,9 @@ class TestAPIInformationEndpoints(IntegrationTestBase):
                 expected_lang in languages
             ), f"Should have {expected_lang} integration guide"
 
+        assert_required_fields = self.assert_required_fields
         for guide in data:
-            required_fields = [
-                "title",
-                "description",
-                "language",
-                "code_example",
-                "prerequisites",
-                "steps",
-            ]
-            self.assert_required_fields(guide, required_fields)
+            assert_required_fields(guide, GUIDE_REQUIRED_FIELDS)
 
             # Validate guide structure
             assert isinstance(guide["title"], str) and len(guide["title"]) > 0
@@ -361,7 +367,7 @@ class TestDocumentationContent(IntegrationTestBase):
 
         for path, methods in paths.items():
             for method, spec in methods.items():
-                if method in ["get", "post", "put", "delete", "patch"]:
+                if method in OPENAPI_OPERATIONS:
                     documented_paths += 1
 
                     # Should have summary or description
@@ -430,8 +436,9 @@ class TestDocumentationAccessibility(IntegrationTestBase):
             "/docs/api/integration-guides",
         ]
 
+        measure_response_time = self.measure_response_time
         for endpoint in doc_endpoints:
-            result = await self.measure_response_time("GET", endpoint)
+            result = await measure_response_time("GET", endpoint)
 
             assert result[
                 "success"
@@ -443,16 +450,7 @@ class TestDocumentationAccessibility(IntegrationTestBase):
     @pytest.mark.asyncio
     async def test_documentation_content_types(self):
         """Test documentation content types and headers."""
-        # JSON endpoints should return JSON
         json_endpoints = ["/openapi.json", "/docs/api", "/docs/api/examples"]
-
-        for endpoint in json_endpoints:
-            response = await self.get(endpoint)
-            assert response.headers.get("content-type", "").startswith(
-                "application/json"
-            ), f"Endpoint {endpoint} should return JSON"
-
-        # HTML endpoints should return HTML
         html_endpoints = [
             "/docs",
             "/redoc",
@@ -460,8 +458,21 @@ class TestDocumentationAccessibility(IntegrationTestBase):
             "/docs/api/custom-redoc",
         ]
 
-        for endpoint in html_endpoints:
-            response = await self.get(endpoint)
+        # Only headers are needed, so fetch them all concurrently
+        responses = await asyncio.gather(
+            *(self.fetch_headers(e) for e in json_endpoints + html_endpoints)
+        )
+        json_responses = responses[: len(json_endpoints)]
+        html_responses = responses[len(json_endpoints) :]
+
+        # JSON endpoints should return JSON
+        for endpoint, response in zip(json_endpoints, json_responses, strict=True):
+            assert response.headers.get("content-type", "").startswith(
+                "application/json"
+            ), f"Endpoint {endpoint} should return JSON"
+
+        # HTML endpoints should return HTML
+        for endpoint, response in zip(html_endpoints, html_responses, strict=True):
             content_type = response.headers.get("content-type", "")
             assert (
                 "text/html" in content_type
@@ -471,8 +482,6 @@ class TestDocumentationAccessibility(IntegrationTestBase):
     @pytest.mark.asyncio
     async def test_documentation_under_load(self):
         """Test documentation endpoints under concurrent load."""
-        import asyncio
-
         # Create concurrent requests to documentation
         endpoints = ["/docs", "/openapi.json", "/docs/api", "/docs/api/examples"]
         tasks = []
@@ -530,10 +539,10 @@ class TestDocumentationSecurity(IntegrationTestBase):
     async def test_no_sensitive_data_exposure(self):
         """Test that documentation doesn't expose sensitive data."""
         response = await self.get("/openapi.json")
-        schema = self.assert_json_response(response)
+        self.assert_json_response(response)
 
-        # Convert to string for searching
-        schema_str = json.dumps(schema).lower()
+        # Search the body as served rather than re-encoding the decoded schema
+        schema_str = response.text.lower()
 
         # Should not contain sensitive patterns
         sensitive_patterns = ["password", "secret", "token", "key", "api_key"]
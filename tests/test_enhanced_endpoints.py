@@ -11,6 +11,8 @@ This module tests:
 - Performance and response validation
 """
 
+import asyncio
+
 import pytest
 
 from tests.test_base import IntegrationTestBase
@@ -29,12 +31,8 @@ class TestEnhancedWeatherStations(IntegrationTestBase):
         self.assert_status_code(response, 200)
         data = self.assert_json_response(response)
 
-        # Validate pagination response structure
-        self.assert_pagination_response(data)
-
-        # Validate weather station items
-        for station in data["items"]:
-            self.assert_weather_station_structure(station)
+        # Validate pagination response structure and weather station items
+        self.assert_items(data, "station")
 
     @pytest.mark.asyncio
     async def test_weather_stations_pagination(self):
@@ -52,16 +50,25 @@ class TestEnhancedWeatherStations(IntegrationTestBase):
         assert pagination_info["page_size"] == 2
         assert pagination_info["items_count"] <= 2
 
-        # If there are more pages, test second page
+        # If there are more pages, follow the keyset cursor to the next one
         if pagination_info["has_next"]:
+            first_page_ids = {station["station_id"] for station in data["items"]}
+            assert pagination_info["next_cursor"]
+
             response = await self.get(
-                "/api/v2/weather-stations", params={"page": 2, "page_size": 2}
+                "/api/v2/weather-stations",
+                params={"cursor": pagination_info["next_cursor"], "page_size": 2},
             )
+            self.assert_status_code(response, 200)
             data = self.assert_json_response(response)
+            self.assert_pagination_response(data)
 
             pagination_info = self.extract_pagination_info(data)
-            assert pagination_info["current_page"] == 2
             assert pagination_info["has_previous"]
+            assert pagination_info["previous_cursor"]
+            assert first_page_ids.isdisjoint(
+                station["station_id"] for station in data["items"]
+            )
 
     @pytest.mark.asyncio
     async def test_weather_stations_search(self):
@@ -111,6 +118,17 @@ class TestEnhancedWeatherStations(IntegrationTestBase):
                 "IA",
             ], f"Station should be in IL or IA: {station}"
 
+    @pytest.mark.asyncio
+    async def test_weather_stations_repeated_request(self):
+        """Test repeated station listings are served consistently."""
+        params = {"states": ["IL", "IA"], "page_size": 5}
+        first = await self.get("/api/v2/weather-stations", params=params)
+        second = await self.get("/api/v2/weather-stations", params=params)
+
+        self.assert_status_code(second, 200)
+        assert second.headers["content-type"] == "application/json"
+        assert self.assert_json_response(second) == self.assert_json_response(first)
+
     @pytest.mark.asyncio
     async def test_weather_stations_sorting(self):
         """Test weather stations sorting."""
@@ -187,6 +205,15 @@ class TestEnhancedWeatherStations(IntegrationTestBase):
             422,
         ], "Invalid sort_order should return error"
 
+        # Unknown sort field
+        response = await self.get(
+            "/api/v2/weather-stations", params={"sort_by": "not_a_field"}
+        )
+        assert response.status_code in [
+            400,
+            422,
+        ], "Unknown sort_by should return error"
+
 
 @pytest.mark.integration
 @pytest.mark.api
@@ -201,12 +228,8 @@ class TestEnhancedDailyWeather(IntegrationTestBase):
         self.assert_status_code(response, 200)
         data = self.assert_json_response(response)
 
-        # Validate pagination response structure
-        self.assert_pagination_response(data)
-
-        # Validate daily weather items
-        for weather in data["items"]:
-            self.assert_daily_weather_structure(weather)
+        # Validate pagination response structure and daily weather items
+        self.assert_items(data, "daily_weather")
 
     @pytest.mark.asyncio
     async def test_daily_weather_date_filtering(self):
@@ -302,6 +325,51 @@ class TestEnhancedDailyWeather(IntegrationTestBase):
             dates, reverse=True
         ), "Weather should be sorted by date descending"
 
+    @pytest.mark.asyncio
+    async def test_daily_weather_cursor_pagination(self):
+        """Test that keyset cursors walk the same rows as page numbers."""
+        params = {"sort_by": "date", "sort_order": "desc", "page_size": 7}
+
+        response = await self.get("/api/v2/daily-weather", params={**params, "page": 2})
+        offset_page = self.assert_json_response(response)
+
+        response = await self.get("/api/v2/daily-weather", params=params)
+        first_page = self.assert_json_response(response)
+        next_cursor = first_page["pagination"]["next_cursor"]
+        if next_cursor is None:
+            pytest.skip("Not enough daily weather records for a second page")
+
+        response = await self.get(
+            "/api/v2/daily-weather", params={**params, "cursor": next_cursor}
+        )
+        self.assert_status_code(response, 200)
+        cursor_page = self.assert_json_response(response)
+        self.assert_pagination_response(cursor_page)
+
+        assert [item["id"] for item in cursor_page["items"]] == [
+            item["id"] for item in offset_page["items"]
+        ]
+        # Cursor pages skip the total count
+        assert cursor_page["pagination"]["total_items"] is None
+
+        # Walking back from the second page returns the first page
+        response = await self.get(
+            "/api/v2/daily-weather",
+            params={**params, "cursor": cursor_page["pagination"]["previous_cursor"]},
+        )
+        previous_page = self.assert_json_response(response)
+        assert [item["id"] for item in previous_page["items"]] == [
+            item["id"] for item in first_page["items"]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_daily_weather_invalid_cursor(self):
+        """Test that malformed cursors are rejected."""
+        response = await self.get(
+            "/api/v2/daily-weather", params={"cursor": "not-a-cursor"}
+        )
+        self.assert_error_response(response, 400)
+
     @pytest.mark.asyncio
     async def test_daily_weather_data_availability_filtering(self):
         """Test filtering by data availability."""
@@ -472,10 +540,11 @@ class TestEnhancedUtilityEndpoints(IntegrationTestBase):
     async def test_sort_info_endpoint(self):
         """Test sort information endpoint."""
         model_types = ["weather_station", "daily_weather", "yearly_stats"]
+        responses = await asyncio.gather(
+            *(self.get(f"/api/v2/sort-info/{model_type}") for model_type in model_types)
+        )
 
-        for model_type in model_types:
-            response = await self.get(f"/api/v2/sort-info/{model_type}")
-
+        for model_type, response in zip(model_types, responses, strict=True):
             self.assert_status_code(response, 200)
             data = self.assert_json_response(response)
 
@@ -525,6 +594,19 @@ class TestEnhancedUtilityEndpoints(IntegrationTestBase):
             assert "parameters" in filter_info
             assert isinstance(filter_info["parameters"], list)
 
+    @pytest.mark.asyncio
+    async def test_filter_info_conditional_request(self):
+        """Test filter info is served with an ETag and honours If-None-Match."""
+        response = await self.get("/api/v2/filter-info")
+
+        self.assert_status_code(response, 200)
+        etag = response.headers.get("etag")
+        assert etag, "Filter info should include an ETag header"
+        assert "max-age" in response.headers.get("cache-control", "")
+
+        cached = await self.get("/api/v2/filter-info", headers={"If-None-Match": etag})
+        self.assert_status_code(cached, 304)
+
 
 @pytest.mark.integration
 @pytest.mark.performance
@@ -540,18 +622,27 @@ class TestEnhancedEndpointsPerformance(IntegrationTestBase):
             "/api/v2/yearly-stats",
         ]
 
-        for endpoint in endpoints:
-            # Test multiple page sizes
-            for page_size in [10, 50, 100]:
-                result = await self.measure_response_time(
+        # Test multiple page sizes, issuing every request concurrently
+        cases = [
+            (endpoint, page_size)
+            for endpoint in endpoints
+            for page_size in [10, 50, 100]
+        ]
+        results = await asyncio.gather(
+            *(
+                self.measure_response_time(
                     "GET", endpoint, params={"page": 1, "page_size": page_size}
                 )
+                for endpoint, page_size in cases
+            )
+        )
 
-                assert result["success"], f"Request to {endpoint} should succeed"
-                assert result["elapsed_time"] < 3.0, (
-                    f"Response time for {endpoint} (page_size={page_size}) too slow: "
-                    f"{result['elapsed_time']}s"
-                )
+        for (endpoint, page_size), result in zip(cases, results, strict=True):
+            assert result["success"], f"Request to {endpoint} should succeed"
+            assert result["elapsed_time"] < 3.0, (
+                f"Response time for {endpoint} (page_size={page_size}) too slow: "
+                f"{result['elapsed_time']}s"
+            )
 
     @pytest.mark.asyncio
     async def test_filtering_performance(self):
@@ -580,29 +671,42 @@ class TestEnhancedEndpointsPerformance(IntegrationTestBase):
     @pytest.mark.asyncio
     async def test_concurrent_enhanced_requests(self):
         """Test concurrent requests to enhanced endpoints."""
-        import asyncio
-
-        # Create multiple concurrent requests
-        tasks = []
         endpoints = [
             "/api/v2/weather-stations",
             "/api/v2/daily-weather",
             "/api/v2/yearly-stats",
         ]
+        params = {"page_size": 10}
+
+        # Fan out over the single shared test client
+        get = self.client.get
+        tasks = [
+            asyncio.ensure_future(get(endpoint, params=params))
+            for endpoint in endpoints
+            for _ in range(3)
+        ]
 
-        for endpoint in endpoints:
-            for _ in range(3):
-                tasks.append(self.get(endpoint, params={"page_size": 10}))
-
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
-
-        successful_responses = 0
-        for response in responses:
-            if not isinstance(response, Exception) and response.status_code == 200:
-                successful_responses += 1
+        # Require an 80% success rate, stopping as soon as it is out of reach
+        max_failures = int(len(tasks) * 0.2)
+        failures = 0
+        try:
+            for next_response in asyncio.as_completed(tasks, timeout=30):
+                try:
+                    response = await next_response
+                except Exception:
+                    failures += 1
+                else:
+                    if response.status_code != 200:
+                        failures += 1
+                if failures > max_failures:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
 
-        success_rate = successful_responses / len(responses)
-        assert success_rate >= 0.8, f"Success rate too low: {success_rate}"
+        assert (
+            failures <= max_failures
+        ), f"Too many failed requests: {failures} of {len(tasks)}"
 
 
 if __name__ == "__main__":
@@ -10,10 +10,142 @@ This module tests:
 - Authentication errors
 """
 
+import asyncio
+import operator
+import re
+from itertools import islice
+
+import httpx
 import pytest
 
 from tests.test_base import IntegrationTestBase
 
+INVALID_ENDPOINTS = (
+    "/api/nonexistent",
+    "/api/v1/weather/nonexistent",
+    "/api/v2/nonexistent",
+    "/docs/nonexistent",
+    "/api/v1/weather/stations/NONEXISTENT123",
+    "/api/v1/stats/yearly/NONEXISTENT123",
+)
+
+BAD_REQUESTS = (
+    ("/api/v2/weather-stations", {"page": "invalid"}),
+    ("/api/v2/weather-stations", {"page_size": "not_a_number"}),
+    ("/api/v2/weather-stations", {"page": -1}),
+    ("/api/v2/weather-stations", {"page_size": 0}),
+    ("/api/v2/weather-stations", {"page_size": 10000}),  # Too large
+    ("/api/v2/daily-weather", {"start_date": "invalid-date"}),
+    ("/api/v2/daily-weather", {"end_date": "2023-13-45"}),  # Invalid date
+    ("/api/v2/daily-weather", {"min_temp": "not_a_number"}),
+    ("/api/v2/daily-weather", {"sort_order": "invalid"}),
+    ("/api/v2/yearly-stats", {"start_year": "invalid"}),
+    ("/api/v2/yearly-stats", {"end_year": 3000}),  # Future year
+)
+
+VALIDATION_ERRORS = (
+    ("/api/v2/weather-stations", {"states": ["INVALID_STATE"]}),
+    ("/api/v2/daily-weather", {"states": ["XX"]}),  # Invalid state code
+    (
+        "/api/v2/daily-weather",
+        {"start_date": "2023-01-01", "end_date": "2022-01-01"},
+    ),  # End before start
+    (
+        "/api/v2/yearly-stats",
+        {"start_year": 2020, "end_year": 2010},
+    ),  # End before start
+)
+
+GET_ONLY_ENDPOINTS = (
+    "/api/v2/weather-stations",
+    "/api/v2/daily-weather",
+    "/api/v2/yearly-stats",
+    "/docs/api",
+    "/health",
+)
+
+EMPTY_FILTERS = (
+    ("/api/v2/weather-stations", {"search": "NONEXISTENT_STATION_12345"}),
+    (
+        "/api/v2/daily-weather",
+        {"start_date": "2030-01-01", "end_date": "2030-01-01"},
+    ),  # Future date
+    (
+        "/api/v2/yearly-stats",
+        {"start_year": 2030, "end_year": 2030},
+    ),  # Future year
+)
+
+BOUNDARY_TESTS = (
+    ("/api/v2/weather-stations", {"page": 1, "page_size": 1}),
+    ("/api/v2/daily-weather", {"page_size": 1}),
+    ("/api/v2/yearly-stats", {"page_size": 1}),
+)
+
+# Request URLs for the boundary cases, with the query string encoded once
+_BOUNDARY_URLS = tuple(
+    (endpoint, params, httpx.URL(endpoint, params=params))
+    for endpoint, params in BOUNDARY_TESTS
+)
+
+SPECIAL_CHAR_TESTS = (
+    (
+        "/api/v2/weather-stations",
+        {"search": "'; DROP TABLE weather_stations; --"},
+    ),  # SQL injection attempt
+    (
+        "/api/v2/weather-stations",
+        {"search": "<script>alert('xss')</script>"},
+    ),  # XSS attempt
+    (
+        "/api/v2/weather-stations",
+        {"search": "../../etc/passwd"},
+    ),  # Path traversal
+    (
+        "/api/v2/weather-stations",
+        {"search": "unicode: 🌦️☀️🌡️"},
+    ),  # Unicode characters
+)
+
+# Edge cases that might cause server errors
+SERVER_ERROR_EDGE_CASES = (
+    ("/api/v2/daily-weather", {"page_size": -2147483648}),  # Integer overflow
+    ("/api/v2/weather-stations", {"page": 999999999}),  # Very large page
+)
+
+_SERVER_ERROR_URLS = tuple(
+    httpx.URL(endpoint, params=params) for endpoint, params in SERVER_ERROR_EDGE_CASES
+)
+
+_LONG_SEARCH = "A" * 1000
+_MANY_IL: list[str] = ["IL"] * 100
+
+LARGE_VALUE_TESTS = (
+    ("/api/v2/weather-stations", {"search": _LONG_SEARCH}),  # Very long search
+    ("/api/v2/daily-weather", {"states": _MANY_IL}),  # Many states
+)
+
+JSON_ENDPOINTS = (
+    "/api/v2/weather-stations",
+    "/api/v2/daily-weather",
+    "/api/v2/yearly-stats",
+    "/docs/api",
+    "/docs/api/examples",
+    "/health",
+)
+
+HTML_ENDPOINTS = (
+    "/docs",
+    "/redoc",
+    "/docs/api/custom-swagger",
+    "/docs/api/custom-redoc",
+)
+
+_NOT_FOUND = frozenset({404})
+
+# Markup that opens an HTML document, looked for near the start of the body
+_HTML_PREFIX_RE = re.compile(rb"(?i)<!doctype|<html")
+
 
 @pytest.mark.integration
 @pytest.mark.api
@@ -21,132 +153,52 @@ class TestHTTPErrorHandling(IntegrationTestBase):
     """Test HTTP error handling and responses."""
 
     @pytest.mark.asyncio
-    async def test_404_errors(self):
+    @pytest.mark.parametrize("endpoint", INVALID_ENDPOINTS)
+    async def test_404_errors(self, endpoint):
         """Test 404 error handling."""
-        invalid_endpoints = [
-            "/api/nonexistent",
-            "/api/v1/weather/nonexistent",
-            "/api/v2/nonexistent",
-            "/docs/nonexistent",
-            "/api/v1/weather/stations/NONEXISTENT123",
-            "/api/v1/stats/yearly/NONEXISTENT123",
-        ]
-
-        for endpoint in invalid_endpoints:
-            response = await self.get(endpoint)
-
-            # Should return 404
-            assert response.status_code == 404, f"Endpoint {endpoint} should return 404"
-
-            # Should have appropriate error format
-            content_type = response.headers.get("content-type", "")
-            if content_type.startswith("application/json"):
-                data = self.assert_json_response(response)
-                assert "error" in data or "detail" in data or "message" in data
+        await self.expect_error(endpoint, allowed=_NOT_FOUND)
 
     @pytest.mark.asyncio
-    async def test_400_bad_request_errors(self):
+    @pytest.mark.parametrize("endpoint,params", BAD_REQUESTS)
+    async def test_400_bad_request_errors(self, endpoint, params):
         """Test 400 Bad Request error handling."""
-        # Test invalid query parameters
-        bad_requests = [
-            ("/api/v2/weather-stations", {"page": "invalid"}),
-            ("/api/v2/weather-stations", {"page_size": "not_a_number"}),
-            ("/api/v2/weather-stations", {"page": -1}),
-            ("/api/v2/weather-stations", {"page_size": 0}),
-            ("/api/v2/weather-stations", {"page_size": 10000}),  # Too large
-            ("/api/v2/daily-weather", {"start_date": "invalid-date"}),
-            ("/api/v2/daily-weather", {"end_date": "2023-13-45"}),  # Invalid date
-            ("/api/v2/daily-weather", {"min_temp": "not_a_number"}),
-            ("/api/v2/daily-weather", {"sort_order": "invalid"}),
-            ("/api/v2/yearly-stats", {"start_year": "invalid"}),
-            ("/api/v2/yearly-stats", {"end_year": 3000}),  # Future year
-        ]
-
-        for endpoint, params in bad_requests:
-            response = await self.get(endpoint, params=params)
-
-            # Should return 400 or 422
-            assert response.status_code in [400, 422], (
-                f"Endpoint {endpoint} with params {params} should return 400/422, "
-                f"got {response.status_code}"
-            )
-
-            # Should have error information
-            if response.headers.get("content-type", "").startswith("application/json"):
-                data = self.assert_json_response(response)
-                assert "error" in data or "detail" in data or "message" in data
+        await self.expect_error(endpoint, params)
 
     @pytest.mark.asyncio
-    async def test_422_validation_errors(self):
+    @pytest.mark.parametrize("endpoint,params", VALIDATION_ERRORS)
+    async def test_422_validation_errors(self, endpoint, params):
         """Test 422 Unprocessable Entity errors."""
-        # Test validation errors
-        validation_errors = [
-            ("/api/v2/weather-stations", {"states": ["INVALID_STATE"]}),
-            ("/api/v2/daily-weather", {"states": ["XX"]}),  # Invalid state code
-            (
-                "/api/v2/daily-weather",
-                {"start_date": "2023-01-01", "end_date": "2022-01-01"},
-            ),  # End before start
-            (
-                "/api/v2/yearly-stats",
-                {"start_year": 2020, "end_year": 2010},
-            ),  # End before start
-        ]
-
-        for endpoint, params in validation_errors:
-            response = await self.get(endpoint, params=params)
-
-            # Should return 422 or 400
-            assert response.status_code in [
-                400,
-                422,
-            ], f"Endpoint {endpoint} with params {params} should return 400/422"
+        await self.expect_error(endpoint, params)
 
     @pytest.mark.asyncio
-    async def test_405_method_not_allowed(self):
+    @pytest.mark.parametrize("endpoint", GET_ONLY_ENDPOINTS)
+    async def test_405_method_not_allowed(self, endpoint):
         """Test 405 Method Not Allowed errors."""
-        # Test wrong HTTP methods
-        endpoints = [
-            "/api/v2/weather-stations",
-            "/api/v2/daily-weather",
-            "/api/v2/yearly-stats",
-            "/docs/api",
-            "/health",
-        ]
-
-        for endpoint in endpoints:
-            # These endpoints should only accept GET
-            response = await self.post(endpoint, json_data={"test": "data"})
+        # These endpoints should only accept GET
+        response = await self.post(endpoint, json_data={"test": "data"})
 
-            # Should return 405
-            assert response.status_code in [
-                405,
-                404,
-            ], f"POST to {endpoint} should return 405 or 404"
+        # Should return 405
+        assert response.status_code in [
+            405,
+            404,
+        ], f"POST to {endpoint} should return 405 or 404"
 
-            # Check for Allow header
-            if response.status_code == 405:
-                assert (
-                    "allow" in response.headers
-                ), "405 response should include Allow header"
+        # Check for Allow header
+        if response.status_code == 405:
+            assert (
+                "allow" in response.headers
+            ), "405 response should include Allow header"
 
     @pytest.mark.asyncio
     async def test_500_server_errors(self):
         """Test server error handling (if any endpoints cause them)."""
-        # Test edge cases that might cause server errors
-        edge_cases = [
-            ("/api/v2/daily-weather", {"page_size": -2147483648}),  # Integer overflow
-            ("/api/v2/weather-stations", {"page": 999999999}),  # Very large page
-        ]
-
-        for endpoint, params in edge_cases:
-            response = await self.get(endpoint, params=params)
+        responses = await asyncio.gather(*map(self.get, _SERVER_ERROR_URLS))
 
+        for url, response in zip(_SERVER_ERROR_URLS, responses, strict=True):
             # Should not return 500
-            assert response.status_code < 500, (
-                f"Endpoint {endpoint} with params {params} should not return 500, "
-                f"got {response.status_code}"
-            )
+            assert (
+                response.status_code < 500
+            ), f"{url} should not return 500, got {response.status_code}"
 
 
 @pytest.mark.integration
@@ -155,122 +207,73 @@ class TestEdgeCases(IntegrationTestBase):
     """Test edge cases and boundary conditions."""
 
     @pytest.mark.asyncio
-    async def test_empty_results(self):
+    @pytest.mark.parametrize("endpoint,params", EMPTY_FILTERS)
+    async def test_empty_results(self, endpoint, params):
         """Test handling of empty results."""
-        # Test filters that should return no results
-        empty_filters = [
-            ("/api/v2/weather-stations", {"search": "NONEXISTENT_STATION_12345"}),
-            (
-                "/api/v2/daily-weather",
-                {"start_date": "2030-01-01", "end_date": "2030-01-01"},
-            ),  # Future date
-            (
-                "/api/v2/yearly-stats",
-                {"start_year": 2030, "end_year": 2030},
-            ),  # Future year
-        ]
-
-        for endpoint, params in empty_filters:
-            response = await self.get(endpoint, params=params)
+        response = await self.get(endpoint, params=params)
 
-            # Should return 200 with empty results
-            self.assert_status_code(response, 200)
-            data = self.assert_json_response(response)
+        # Should return 200 with empty results
+        self.assert_status_code(response, 200)
+        data = self.assert_json_response(response)
 
-            # Should be paginated response with empty items
-            self.assert_pagination_response(data)
-            assert (
-                len(data["items"]) == 0
-            ), f"Should return empty results for {endpoint}"
-            assert data["pagination"]["total_items"] == 0
+        # Should be paginated response with empty items
+        self.assert_pagination_response(data)
+        assert len(data["items"]) == 0, f"Should return empty results for {endpoint}"
+        assert data["pagination"]["total_items"] == 0
 
     @pytest.mark.asyncio
-    async def test_boundary_values(self):
+    @pytest.mark.parametrize("endpoint,params,url", _BOUNDARY_URLS)
+    async def test_boundary_values(self, endpoint, params, url):
         """Test boundary values for parameters."""
-        # Test minimum valid values
-        boundary_tests = [
-            ("/api/v2/weather-stations", {"page": 1, "page_size": 1}),
-            ("/api/v2/daily-weather", {"page_size": 1}),
-            ("/api/v2/yearly-stats", {"page_size": 1}),
-        ]
-
-        for endpoint, params in boundary_tests:
-            response = await self.get(endpoint, params=params)
+        response = await self.get(url)
 
-            # Should handle boundary values gracefully
-            assert response.status_code in [
-                200,
-                400,
-                422,
-            ], f"Endpoint {endpoint} should handle boundary values gracefully"
+        # Should handle boundary values gracefully
+        assert response.status_code in [
+            200,
+            400,
+            422,
+        ], f"Endpoint {endpoint} should handle boundary values gracefully"
 
-            if response.status_code == 200:
-                data = self.assert_json_response(response)
-                self.assert_pagination_response(data)
+        if response.status_code == 200:
+            data = self.assert_json_response(response)
+            self.assert_pagination_response(data)
 
-                # Should respect page_size limit
-                assert len(data["items"]) <= params.get("page_size", 50)
+            # Should respect page_size limit
+            assert len(data["items"]) <= params.get("page_size", 50)
 
     @pytest.mark.asyncio
-    async def test_special_characters(self):
+    @pytest.mark.parametrize("endpoint,params", SPECIAL_CHAR_TESTS)
+    async def test_special_characters(self, endpoint, params):
         """Test handling of special characters in parameters."""
-        special_char_tests = [
-            (
-                "/api/v2/weather-stations",
-                {"search": "'; DROP TABLE weather_stations; --"},
-            ),  # SQL injection attempt
-            (
-                "/api/v2/weather-stations",
-                {"search": "<script>alert('xss')</script>"},
-            ),  # XSS attempt
-            (
-                "/api/v2/weather-stations",
-                {"search": "../../etc/passwd"},
-            ),  # Path traversal
-            (
-                "/api/v2/weather-stations",
-                {"search": "unicode: 🌦️☀️🌡️"},
-            ),  # Unicode characters
-        ]
+        status_code = await self.fetch_status(endpoint, params=params)
 
-        for endpoint, params in special_char_tests:
-            response = await self.get(endpoint, params=params)
+        # Should handle special characters safely
+        assert status_code in [
+            200,
+            400,
+            422,
+        ], f"Endpoint {endpoint} should handle special characters safely"
 
-            # Should handle special characters safely
-            assert response.status_code in [
-                200,
-                400,
-                422,
-            ], f"Endpoint {endpoint} should handle special characters safely"
-
-            # Should not return server errors
-            assert (
-                response.status_code < 500
-            ), f"Special characters should not cause server errors in {endpoint}"
+        # Should not return server errors
+        assert (
+            status_code < 500
+        ), f"Special characters should not cause server errors in {endpoint}"
 
     @pytest.mark.asyncio
-    async def test_large_parameter_values(self):
+    @pytest.mark.parametrize("endpoint,params", LARGE_VALUE_TESTS)
+    async def test_large_parameter_values(self, endpoint, params):
         """Test handling of large parameter values."""
-        large_value_tests = [
-            (
-                "/api/v2/weather-stations",
-                {"search": "A" * 1000},
-            ),  # Very long search string
-            ("/api/v2/daily-weather", {"states": ["IL"] * 100}),  # Many states
-        ]
-
-        for endpoint, params in large_value_tests:
-            response = await self.get(endpoint, params=params)
+        status_code = await self.fetch_status(endpoint, params=params)
 
-            # Should handle large values gracefully
-            assert response.status_code in [
-                200,
-                400,
-                422,
-            ], f"Endpoint {endpoint} should handle large values gracefully"
+        # Should handle large values gracefully
+        assert status_code in [
+            200,
+            400,
+            422,
+        ], f"Endpoint {endpoint} should handle large values gracefully"
 
-            # Should not cause server errors
-            assert response.status_code < 500
+        # Should not cause server errors
+        assert status_code < 500
 
 
 @pytest.mark.integration
@@ -282,8 +285,6 @@ class TestConcurrencyAndLoad(IntegrationTestBase):
     @pytest.mark.asyncio
     async def test_concurrent_requests(self):
         """Test handling of concurrent requests."""
-        import asyncio
-
         # Create many concurrent requests
         endpoints = [
             "/api/v2/weather-stations",
@@ -293,22 +294,31 @@ class TestConcurrencyAndLoad(IntegrationTestBase):
             "/health",
         ]
 
-        tasks = []
-        for _ in range(10):
-            for endpoint in endpoints:
-                tasks.append(self.get(endpoint, params={"page_size": 5}))
+        # Cap in-flight requests explicitly so the test measures the server,
+        # not queuing inside the client
+        semaphore = asyncio.Semaphore(64)
+
+        async def bounded_get(endpoint):
+            async with semaphore:
+                return await self.get(endpoint, params={"page_size": 5})
 
         # Execute all requests concurrently
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
+        responses = await asyncio.gather(
+            *(bounded_get(endpoint) for _ in range(10) for endpoint in endpoints),
+            return_exceptions=True,
+        )
 
         # Analyze results
         successful_responses = 0
         client_errors = 0
         server_errors = 0
+        timeouts = 0
         exceptions = 0
 
         for response in responses:
-            if isinstance(response, Exception):
+            if isinstance(response, httpx.TimeoutException | asyncio.TimeoutError):
+                timeouts += 1
+            elif isinstance(response, Exception):
                 exceptions += 1
             else:
                 if response.status_code < 400:
@@ -320,7 +330,10 @@ class TestConcurrencyAndLoad(IntegrationTestBase):
 
         # Should handle concurrent requests well
         success_rate = successful_responses / len(responses)
-        assert success_rate >= 0.7, f"Success rate too low under load: {success_rate}"
+        assert success_rate >= 0.7, (
+            f"Success rate too low under load: {success_rate} "
+            f"({timeouts} timeouts, {exceptions} other exceptions)"
+        )
 
         # Should not have many server errors
         server_error_rate = server_errors / len(responses)
@@ -332,12 +345,10 @@ class TestConcurrencyAndLoad(IntegrationTestBase):
     async def test_timeout_handling(self):
         """Test request timeout handling."""
         # Test with very small timeout (this might not work in all environments)
-        import httpx
-
         try:
-            async with httpx.AsyncClient(timeout=0.001) as client:
-                await client.get("http://test/api/v2/weather-stations")
-                # If this doesn't timeout, that's also OK
+            # Override the timeout per request on the shared client
+            await self.client.get("/api/v2/weather-stations", timeout=0.001)
+            # If this doesn't timeout, that's also OK
         except httpx.TimeoutException:
             # Expected behavior
             pass
@@ -350,11 +361,19 @@ class TestConcurrencyAndLoad(IntegrationTestBase):
     async def test_memory_stability(self):
         """Test memory stability under repeated requests."""
         # Make many requests to check for memory leaks
-        endpoint = "/api/v2/weather-stations"
+        # Encode the query string once for all 50 identical requests
+        url = httpx.URL("/api/v2/weather-stations", params={"page_size": 10})
 
-        for i in range(50):
-            response = await self.get(endpoint, params={"page_size": 10})
+        # Keep at most 10 requests in flight while issuing all 50
+        semaphore = asyncio.Semaphore(10)
 
+        async def bounded_get():
+            async with semaphore:
+                return await self.get(url)
+
+        responses = await asyncio.gather(*(bounded_get() for _ in range(50)))
+
+        for i, response in enumerate(responses):
             # Should continue to work
             assert response.status_code in [
                 200,
@@ -365,7 +384,7 @@ class TestConcurrencyAndLoad(IntegrationTestBase):
             # Ensure response is handled properly
             if response.status_code == 200:
                 data = self.assert_json_response(response)
-                assert isinstance(data, dict)
+                assert type(data) is dict
 
 
 @pytest.mark.integration
@@ -376,36 +395,36 @@ class TestDataIntegrity(IntegrationTestBase):
     @pytest.mark.asyncio
     async def test_data_consistency_across_pages(self):
         """Test data consistency across pagination."""
-        # Get first page
-        response1 = await self.get(
-            "/api/v2/weather-stations", params={"page": 1, "page_size": 5}
+        # Fetch the first two pages together; page 2 is only compared when
+        # page 1 reports that it exists
+        response1, response2 = await asyncio.gather(
+            *(
+                self.get(
+                    "/api/v2/weather-stations", params={"page": page, "page_size": 5}
+                )
+                for page in (1, 2)
+            )
         )
 
         if response1.status_code == 200:
             data1 = self.assert_json_response(response1)
+            pagination1 = data1["pagination"]
 
-            if data1["pagination"]["has_next"]:
-                # Get second page
-                response2 = await self.get(
-                    "/api/v2/weather-stations", params={"page": 2, "page_size": 5}
-                )
-
+            if pagination1["has_next"]:
                 if response2.status_code == 200:
                     data2 = self.assert_json_response(response2)
 
                     # Should not have duplicate items
-                    ids1 = {item["id"] for item in data1["items"]}
-                    ids2 = {item["id"] for item in data2["items"]}
-
-                    overlap = ids1.intersection(ids2)
+                    overlap = {item["station_id"] for item in data1["items"]} & {
+                        item["station_id"] for item in data2["items"]
+                    }
                     assert (
                         len(overlap) == 0
                     ), f"Pages should not have duplicate items: {overlap}"
 
                     # Total items should be consistent
                     assert (
-                        data1["pagination"]["total_items"]
-                        == data2["pagination"]["total_items"]
+                        pagination1["total_items"] == data2["pagination"]["total_items"]
                     )
 
     @pytest.mark.asyncio
@@ -437,8 +456,8 @@ class TestDataIntegrity(IntegrationTestBase):
             if len(data["items"]) > 1:
                 # Should be sorted by name
                 names = [station["name"] for station in data["items"]]
-                assert names == sorted(
-                    names
+                assert all(
+                    map(operator.le, names, islice(names, 1, None))
                 ), f"Results should be sorted by name: {names}"
 
 
@@ -450,18 +469,14 @@ class TestResponseFormats(IntegrationTestBase):
     @pytest.mark.asyncio
     async def test_json_response_format(self):
         """Test JSON response format consistency."""
-        json_endpoints = [
-            "/api/v2/weather-stations",
-            "/api/v2/daily-weather",
-            "/api/v2/yearly-stats",
-            "/docs/api",
-            "/docs/api/examples",
-            "/health",
-        ]
-
-        for endpoint in json_endpoints:
-            response = await self.get(endpoint, params={"page_size": 5})
+        responses = await asyncio.gather(
+            *(
+                self.get(endpoint, params={"page_size": 5})
+                for endpoint in JSON_ENDPOINTS
+            )
+        )
 
+        for endpoint, response in zip(JSON_ENDPOINTS, responses, strict=True):
             if response.status_code == 200:
                 # Should have JSON content type
                 content_type = response.headers.get("content-type", "")
@@ -471,21 +486,16 @@ class TestResponseFormats(IntegrationTestBase):
 
                 # Should be valid JSON
                 data = self.assert_json_response(response)
-                assert isinstance(data, dict | list)
+                assert type(data) in (dict, list)
 
     @pytest.mark.asyncio
     async def test_html_response_format(self):
         """Test HTML response format consistency."""
-        html_endpoints = [
-            "/docs",
-            "/redoc",
-            "/docs/api/custom-swagger",
-            "/docs/api/custom-redoc",
-        ]
-
-        for endpoint in html_endpoints:
-            response = await self.get(endpoint)
+        responses = await asyncio.gather(
+            *(self.get(endpoint) for endpoint in HTML_ENDPOINTS)
+        )
 
+        for endpoint, response in zip(HTML_ENDPOINTS, responses, strict=True):
             if response.status_code == 200:
                 # Should have HTML content type
                 content_type = response.headers.get("content-type", "")
@@ -493,9 +503,10 @@ class TestResponseFormats(IntegrationTestBase):
                     "text/html" in content_type
                 ), f"Endpoint {endpoint} should return HTML"
 
-                # Should be valid HTML
-                html_content = self.assert_html_response(response)
-                assert "<html" in html_content or "<!DOCTYPE" in html_content
+                # Should be valid HTML; the document opens within the first bytes
+                assert _HTML_PREFIX_RE.search(
+                    response.content[:256]
+                ), f"Endpoint {endpoint} should return an HTML document"
 
     @pytest.mark.asyncio
     async def test_error_response_format(self):
@@ -505,16 +516,7 @@ class TestResponseFormats(IntegrationTestBase):
 
         if response.status_code >= 400:
             # Error should have consistent format
-            content_type = response.headers.get("content-type", "")
-            if content_type.startswith("application/json"):
-                data = self.assert_json_response(response)
-
-                # Should have error information
-                error_fields = ["error", "detail", "message"]
-                has_error_field = any(field in data for field in error_fields)
-                assert (
-                    has_error_field
-                ), f"Error response should have error information: {data}"
+            self.assert_error_body(response)
 
 
 if __name__ == "__main__":
@@ -9,10 +9,38 @@ This module tests:
 - Performance and availability
 """
 
+import asyncio
+import operator
+from datetime import datetime
+from typing import Any
+
+import orjson
 import pytest
+import pytest_asyncio
+from httpx import AsyncClient, Response
 
 from tests.test_base import IntegrationTestBase
 
+SYSTEM_ENDPOINTS = ("/", "/health", "/info")
+
+_VALID_STATUSES = frozenset({"healthy", "unhealthy", "degraded"})
+_VALID_ENVIRONMENTS = frozenset({"development", "testing", "staging", "production"})
+_SECURITY_HEADERS = frozenset({"x-content-type-options", "x-frame-options"})
+
+
+@pytest_asyncio.fixture(scope="class")
+async def root_payload(client: AsyncClient) -> tuple[Response, dict[str, Any]]:
+    """Fetch the root endpoint once per test class; its payload is static."""
+    response = await client.get("/")
+    return response, orjson.loads(response.content)
+
+
+@pytest_asyncio.fixture(scope="class")
+async def info_payload(client: AsyncClient) -> tuple[Response, dict[str, Any]]:
+    """Fetch the system info endpoint once per test class."""
+    response = await client.get("/info")
+    return response, orjson.loads(response.content)
+
 
 @pytest.mark.integration
 @pytest.mark.api
@@ -21,7 +49,7 @@ class TestHealthEndpoints(IntegrationTestBase):
 
     @pytest.mark.asyncio
     async def test_health_check_basic(self):
-        """Test basic health check endpoint."""
+        """Test health check endpoint, both required and optional fields."""
         response = await self.get("/health")
 
         self.assert_status_code(response, 200)
@@ -33,17 +61,11 @@ class TestHealthEndpoints(IntegrationTestBase):
 
         # Validate field types and values
         assert isinstance(data["status"], str)
-        assert data["status"] in ["healthy", "unhealthy", "degraded"]
+        assert data["status"] in _VALID_STATUSES
 
         # Validate timestamp format
         self.assert_date_format(data["timestamp"])
 
-    @pytest.mark.asyncio
-    async def test_health_check_detailed(self):
-        """Test detailed health check response."""
-        response = await self.get("/health")
-        data = self.assert_json_response(response)
-
         # Should contain additional health information
         expected_optional_fields = ["version", "uptime", "environment"]
         for field in expected_optional_fields:
@@ -70,12 +92,12 @@ class TestHealthEndpoints(IntegrationTestBase):
             assert "status" in data
 
     @pytest.mark.asyncio
-    async def test_root_endpoint(self):
+    async def test_root_endpoint(self, root_payload):
         """Test root API information endpoint."""
-        response = await self.get("/")
+        response, data = root_payload
 
         self.assert_status_code(response, 200)
-        data = self.assert_json_response(response)
+        assert response.headers.get("content-type", "").startswith("application/json")
 
         # Validate root endpoint structure
         required_fields = ["message", "version", "documentation", "endpoints"]
@@ -104,12 +126,12 @@ class TestHealthEndpoints(IntegrationTestBase):
             assert endpoint_path.startswith("/")
 
     @pytest.mark.asyncio
-    async def test_api_info_endpoint(self):
+    async def test_api_info_endpoint(self, info_payload):
         """Test system information endpoint."""
-        response = await self.get("/info")
+        response, data = info_payload
 
         self.assert_status_code(response, 200)
-        data = self.assert_json_response(response)
+        assert response.headers.get("content-type", "").startswith("application/json")
 
         # Validate system info structure
         expected_sections = ["api", "database", "django"]
@@ -139,22 +161,22 @@ class TestHealthEndpoints(IntegrationTestBase):
     @pytest.mark.asyncio
     async def test_health_response_consistency(self):
         """Test that health check responses are consistent across multiple calls."""
-        responses = []
-
         # Make multiple requests
-        for _ in range(3):
-            response = await self.get("/health")
+        responses = []
+        for response in await asyncio.gather(*(self.get("/health") for _ in range(3))):
             self.assert_status_code(response, 200)
-            data = self.assert_json_response(response)
-            responses.append(data)
+            responses.append(self.assert_json_response(response))
 
         # All responses should have the same status
         statuses = [r["status"] for r in responses]
         assert len(set(statuses)) == 1, "Health status should be consistent"
 
-        # Timestamps should be different (requests made at different times)
-        timestamps = [r["timestamp"] for r in responses]
-        assert len(set(timestamps)) == len(timestamps), "Timestamps should be unique"
+        # Timestamps should follow request order; two requests can share a
+        # timestamp at the server's clock resolution, so equal ones are fine
+        timestamps = [datetime.fromisoformat(r["timestamp"]) for r in responses]
+        assert all(
+            map(operator.le, timestamps, timestamps[1:])
+        ), f"Timestamps should not go backwards: {timestamps}"
 
     @pytest.mark.performance
     @pytest.mark.asyncio
@@ -168,6 +190,30 @@ class TestHealthEndpoints(IntegrationTestBase):
             result["elapsed_time"] < 1.0
         ), f"Health check too slow: {result['elapsed_time']}s"
 
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_liveness_endpoint_performance(self):
+        """Test that the liveness probe stays on a fast path."""
+        # Liveness only checks the process, so it gets a much tighter budget
+        # than probes that depend on the database
+        result = await self.measure_response_time("GET", "/health/liveness")
+
+        assert result["success"], "Liveness check should succeed"
+        assert (
+            result["elapsed_time"] < 0.1
+        ), f"Liveness check too slow: {result['elapsed_time']}s"
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_readiness_endpoint_performance(self):
+        """Test readiness probe response time."""
+        result = await self.measure_response_time("GET", "/health/readiness")
+
+        assert result["success"], "Readiness check should succeed"
+        assert (
+            result["elapsed_time"] < 1.0
+        ), f"Readiness check too slow: {result['elapsed_time']}s"
+
     @pytest.mark.asyncio
     async def test_health_endpoint_headers(self):
         """Test health endpoint response headers."""
@@ -177,56 +223,46 @@ class TestHealthEndpoints(IntegrationTestBase):
         assert "content-type" in response.headers
         assert response.headers["content-type"].startswith("application/json")
 
-        # Check for security headers (if implemented)
-        security_headers = ["x-content-type-options", "x-frame-options"]
-        for header in security_headers:
-            if header in response.headers:
-                # If present, should have secure values
-                assert response.headers[header] is not None
+        # Check for security headers (if implemented); httpx reports header
+        # names in lower case
+        for header in _SECURITY_HEADERS.intersection(response.headers.keys()):
+            # If present, should have secure values
+            assert response.headers[header], f"{header} should not be empty"
 
     @pytest.mark.asyncio
-    async def test_endpoints_accessibility(self):
-        """Test that all system endpoints are accessible."""
-        endpoints = ["/", "/health", "/info"]
-
-        results = await self.test_endpoint_accessibility(endpoints)
+    @pytest.mark.parametrize("endpoint", SYSTEM_ENDPOINTS)
+    async def test_endpoint_accessible(self, endpoint):
+        """Test that each system endpoint is accessible."""
+        response = await self.get(endpoint)
 
-        for endpoint, result in results.items():
-            assert result["accessible"], f"Endpoint {endpoint} should be accessible"
-            assert (
-                result["status_code"] == 200
-            ), f"Endpoint {endpoint} should return 200"
+        self.assert_status_code(response, 200)
+        self.assert_json_response(response)
 
     @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_health_under_load(self):
         """Test health endpoint under multiple concurrent requests."""
-        import asyncio
-
         # Create multiple concurrent requests
-        tasks = [self.get("/health") for _ in range(10)]
-        responses = await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self.get("/health")) for _ in range(10)]
+        responses = [task.result() for task in tasks]
 
         # All requests should succeed
         for i, response in enumerate(responses):
             assert response.status_code == 200, f"Request {i} should succeed"
             data = self.assert_json_response(response)
-            assert data["status"] in ["healthy", "unhealthy", "degraded"]
+            assert data["status"] in _VALID_STATUSES
 
     @pytest.mark.asyncio
     async def test_invalid_health_methods(self):
         """Test that health endpoint only accepts GET requests."""
-        # Test other HTTP methods
-        methods_to_test = ["POST", "PUT", "DELETE"]
-
-        for method in methods_to_test:
-            if method == "POST":
-                response = await self.post("/health")
-            elif method == "PUT":
-                response = await self.put("/health")
-            elif method == "DELETE":
-                response = await self.delete("/health")
+        # Test other HTTP methods; the probes are independent, so send them together
+        methods_to_test = ("POST", "PUT", "DELETE")
+        responses = await asyncio.gather(
+            self.post("/health"), self.put("/health"), self.delete("/health")
+        )
 
+        for method, response in zip(methods_to_test, responses, strict=True):
             # Should return method not allowed or not found
             assert response.status_code in [
                 405,
@@ -234,10 +270,9 @@ class TestHealthEndpoints(IntegrationTestBase):
             ], f"Health endpoint should not accept {method} requests"
 
     @pytest.mark.asyncio
-    async def test_root_endpoint_content_validation(self):
+    async def test_root_endpoint_content_validation(self, root_payload):
         """Test detailed validation of root endpoint content."""
-        response = await self.get("/")
-        data = self.assert_json_response(response)
+        _, data = root_payload
 
         # Validate API message
         assert "Weather Data Engineering API" in data["message"]
@@ -250,18 +285,21 @@ class TestHealthEndpoints(IntegrationTestBase):
         ), "Version should have at least major.minor format"
 
         # Validate documentation URLs are valid paths
-        docs = data["documentation"]
-        for _doc_type, url in docs.items():
+        doc_urls = list(data["documentation"].values())
+        for url in doc_urls:
             assert url.startswith(
                 "/"
             ), f"Documentation URL should be absolute path: {url}"
 
-            # Test that documentation endpoints are accessible
-            doc_response = await self.get(url)
-            assert doc_response.status_code in [
+        # Test that documentation endpoints are accessible; only the status
+        # matters, so HEAD is used and the (large) docs and schema bodies are
+        # never sent
+        doc_responses = await asyncio.gather(*map(self.fetch_headers, doc_urls))
+        for url, doc_response in zip(doc_urls, doc_responses, strict=True):
+            assert doc_response.status_code in (
                 200,
                 302,
-            ], f"Documentation endpoint {url} should be accessible"
+            ), f"Documentation endpoint {url} should be accessible"
 
         # Validate endpoint URLs
         endpoints = data["endpoints"]
@@ -271,10 +309,9 @@ class TestHealthEndpoints(IntegrationTestBase):
             ), f"Endpoint URL should be absolute path: {endpoint_url}"
 
     @pytest.mark.asyncio
-    async def test_system_info_content_validation(self):
+    async def test_system_info_content_validation(self, info_payload):
         """Test detailed validation of system info content."""
-        response = await self.get("/info")
-        data = self.assert_json_response(response)
+        _, data = info_payload
 
         # Validate API information
         if "api" in data:
@@ -283,8 +320,7 @@ class TestHealthEndpoints(IntegrationTestBase):
 
             # Environment should be a valid value
             if "environment" in api_info:
-                valid_environments = ["development", "testing", "staging", "production"]
-                assert api_info["environment"] in valid_environments
+                assert api_info["environment"] in _VALID_ENVIRONMENTS
 
         # Validate database information
         if "database" in data:
@@ -322,7 +358,7 @@ class TestSystemPerformance(IntegrationTestBase):
     @pytest.mark.asyncio
     async def test_response_times(self):
         """Test response times for all system endpoints."""
-        endpoints = ["/", "/health", "/info"]
+        endpoints = SYSTEM_ENDPOINTS
 
         results = await self.test_response_times(endpoints, max_time=2.0)
 
@@ -336,27 +372,21 @@ class TestSystemPerformance(IntegrationTestBase):
     @pytest.mark.asyncio
     async def test_concurrent_requests(self):
         """Test handling of concurrent requests to system endpoints."""
-        import asyncio
-
-        # Create concurrent requests to different endpoints
-        tasks = []
-        endpoints = ["/", "/health", "/info"]
-
-        for _ in range(5):
-            for endpoint in endpoints:
-                tasks.append(self.get(endpoint))
-
-        # Execute all requests concurrently
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
+        # Execute requests to different endpoints concurrently. GETs are
+        # dispatched in-process, so there are no transport errors to count as
+        # misses; a request that raises cancels the rest and fails the test
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self.get(endpoint))
+                for _ in range(5)
+                for endpoint in SYSTEM_ENDPOINTS
+            ]
+        responses = [task.result() for task in tasks]
 
         # Validate all responses
-        successful_responses = 0
-        for response in responses:
-            if isinstance(response, Exception):
-                pytest.fail(f"Request failed with exception: {response}")
-            else:
-                if response.status_code == 200:
-                    successful_responses += 1
+        successful_responses = sum(
+            response.status_code == 200 for response in responses
+        )
 
         # At least 80% of requests should succeed
         success_rate = successful_responses / len(responses)
@@ -365,9 +395,11 @@ class TestSystemPerformance(IntegrationTestBase):
     @pytest.mark.asyncio
     async def test_memory_usage_stability(self):
         """Test that repeated requests don't cause memory issues."""
-        # Make many requests to check for memory leaks
-        for _ in range(20):
-            response = await self.get("/health")
+        # Make many requests to check for memory leaks; they are independent,
+        # so issue them together
+        responses = await asyncio.gather(*(self.get("/health") for _ in range(20)))
+
+        for response in responses:
             self.assert_status_code(response, 200)
 
             # Ensure response is properly handled
@@ -10,9 +10,31 @@ This module tests:
 - Data validation
 """
 
+import asyncio
+import operator
+import os
+import sys
+from datetime import date
+
 import pytest
 
-from tests.test_base import IntegrationTestBase
+from tests.test_base import ITEM_VALIDATORS, IntegrationTestBase, requires_endpoint
+
+# Statuses of an endpoint that is either working or not implemented
+_OK_OR_UNIMPLEMENTED = frozenset({200, 404, 501})
+
+_station_id = operator.itemgetter("station_id")
+
+# Fields a statistics summary may contain
+_STAT_FIELDS = frozenset(
+    {"total_stations", "total_records", "date_range", "statistics"}
+)
+
+# Wall-clock limits mean nothing while xdist workers compete for the CPU or a
+# tracer (coverage, debugger) slows every call down
+_TIMING_UNRELIABLE = bool(os.environ.get("PYTEST_XDIST_WORKER")) or (
+    sys.gettrace() is not None
+)
 
 
 @pytest.mark.integration
@@ -21,78 +43,46 @@ class TestWeatherV1Endpoints(IntegrationTestBase):
     """Test weather API v1 endpoints."""
 
     @pytest.mark.asyncio
-    async def test_weather_stations_v1(self):
-        """Test weather stations v1 endpoint."""
-        response = await self.get("/api/v1/weather/stations")
+    @pytest.mark.parametrize(
+        "path,kind",
+        [
+            ("/api/v1/weather/stations", "station"),
+            ("/api/v1/weather/daily", "daily_weather"),
+            ("/api/v1/weather/daily/TEST001", "daily_weather"),
+        ],
+        ids=["stations", "daily", "daily_by_station"],
+    )
+    async def test_v1_collection_endpoint(self, path, kind):
+        """Test v1 endpoints that return a list or paginated response."""
+        await self.require_endpoint(path)
+        response = await self.cached_get(path)
 
-        # Should return 200 or 404 (if not implemented)
-        assert response.status_code in [200, 404, 501]
+        # Should return 200, 404, or 501
+        assert response.status_code in _OK_OR_UNIMPLEMENTED
 
         if response.status_code == 200:
             data = self.assert_json_response(response)
 
             # Should be a list or paginated response
             if isinstance(data, list):
-                for station in data:
-                    self.assert_weather_station_structure(station)
+                self.assert_all(ITEM_VALIDATORS[kind], data)
             elif isinstance(data, dict) and "items" in data:
-                self.assert_pagination_response(data)
-                for station in data["items"]:
-                    self.assert_weather_station_structure(station)
+                self.assert_items(data, kind)
 
     @pytest.mark.asyncio
+    @requires_endpoint("/api/v1/weather/stations/TEST001")
     async def test_weather_station_detail_v1(self):
         """Test individual weather station endpoint."""
-        response = await self.get("/api/v1/weather/stations/TEST001")
+        response = await self.cached_get("/api/v1/weather/stations/TEST001")
 
         # Should return 200, 404, or 501
-        assert response.status_code in [200, 404, 501]
+        assert response.status_code in _OK_OR_UNIMPLEMENTED
 
         if response.status_code == 200:
             data = self.assert_json_response(response)
             self.assert_weather_station_structure(data)
             assert data["station_id"] == "TEST001"
 
-    @pytest.mark.asyncio
-    async def test_daily_weather_v1(self):
-        """Test daily weather v1 endpoint."""
-        response = await self.get("/api/v1/weather/daily")
-
-        # Should return 200 or 404 (if not implemented)
-        assert response.status_code in [200, 404, 501]
-
-        if response.status_code == 200:
-            data = self.assert_json_response(response)
-
-            # Should be a list or paginated response
-            if isinstance(data, list):
-                for weather in data:
-                    self.assert_daily_weather_structure(weather)
-            elif isinstance(data, dict) and "items" in data:
-                self.assert_pagination_response(data)
-                for weather in data["items"]:
-                    self.assert_daily_weather_structure(weather)
-
-    @pytest.mark.asyncio
-    async def test_daily_weather_by_station_v1(self):
-        """Test daily weather by station v1 endpoint."""
-        response = await self.get("/api/v1/weather/daily/TEST001")
-
-        # Should return 200, 404, or 501
-        assert response.status_code in [200, 404, 501]
-
-        if response.status_code == 200:
-            data = self.assert_json_response(response)
-
-            # Should be a list or paginated response
-            if isinstance(data, list):
-                for weather in data:
-                    self.assert_daily_weather_structure(weather)
-            elif isinstance(data, dict) and "items" in data:
-                self.assert_pagination_response(data)
-                for weather in data["items"]:
-                    self.assert_daily_weather_structure(weather)
-
 
 @pytest.mark.integration
 @pytest.mark.api
@@ -110,11 +100,13 @@ class TestSimpleWeatherAPI(IntegrationTestBase):
             "/api/weather/daily",
         ]
 
-        for endpoint in simple_endpoints:
-            response = await self.get(endpoint)
+        responses = await asyncio.gather(*map(self.get, simple_endpoints))
 
+        for endpoint, response in zip(simple_endpoints, responses, strict=True):
             # Should return 200 or 404 (if not implemented)
-            assert response.status_code in [200, 404, 501]
+            assert (
+                response.status_code in _OK_OR_UNIMPLEMENTED
+            ), f"Endpoint {endpoint} returned {response.status_code}"
 
             if response.status_code == 200:
                 data = self.assert_json_response(response)
@@ -139,12 +131,13 @@ class TestStatisticsEndpoints(IntegrationTestBase):
     """Test statistics and analytics endpoints."""
 
     @pytest.mark.asyncio
+    @requires_endpoint("/api/v1/stats/summary")
     async def test_stats_summary(self):
         """Test statistics summary endpoint."""
-        response = await self.get("/api/v1/stats/summary")
+        response = await self.cached_get("/api/v1/stats/summary")
 
         # Should return 200 or 404 (if not implemented)
-        assert response.status_code in [200, 404, 501]
+        assert response.status_code in _OK_OR_UNIMPLEMENTED
 
         if response.status_code == 200:
             data = self.assert_json_response(response)
@@ -152,24 +145,18 @@ class TestStatisticsEndpoints(IntegrationTestBase):
             # Should be a dictionary with statistics
             assert isinstance(data, dict)
 
-            # Should contain statistical information
-            stat_fields = [
-                "total_stations",
-                "total_records",
-                "date_range",
-                "statistics",
-            ]
-            for field in stat_fields:
-                if field in data:
-                    assert data[field] is not None
+            # Statistical information that is present should be set
+            for field in _STAT_FIELDS & data.keys():
+                assert data[field] is not None, f"{field} should not be null"
 
     @pytest.mark.asyncio
+    @requires_endpoint("/api/v1/stats/yearly/TEST001")
     async def test_yearly_stats_by_station(self):
         """Test yearly statistics by station."""
-        response = await self.get("/api/v1/stats/yearly/TEST001")
+        response = await self.cached_get("/api/v1/stats/yearly/TEST001")
 
         # Should return 200, 404, or 501
-        assert response.status_code in [200, 404, 501]
+        assert response.status_code in _OK_OR_UNIMPLEMENTED
 
         if response.status_code == 200:
             data = self.assert_json_response(response)
@@ -191,39 +178,22 @@ class TestCropYieldEndpoints(IntegrationTestBase):
     """Test crop yield data endpoints."""
 
     @pytest.mark.asyncio
+    @requires_endpoint("/api/v1/crops/yield")
     async def test_crop_yield_endpoint(self):
         """Test crop yield data endpoint."""
-        response = await self.get("/api/v1/crops/yield")
+        response = await self.cached_get("/api/v1/crops/yield")
 
         # Should return 200 or 404 (if not implemented)
-        assert response.status_code in [200, 404, 501]
+        assert response.status_code in _OK_OR_UNIMPLEMENTED
 
         if response.status_code == 200:
             data = self.assert_json_response(response)
 
             # Should be a list or paginated response
             if isinstance(data, list):
-                for crop in data:
-                    self.assert_crop_yield_structure(crop)
+                self.assert_all(ITEM_VALIDATORS["crop_yield"], data)
             elif isinstance(data, dict) and "items" in data:
-                self.assert_pagination_response(data)
-                for crop in data["items"]:
-                    self.assert_crop_yield_structure(crop)
-
-    def assert_crop_yield_structure(self, crop_data: dict):
-        """Assert crop yield data structure."""
-        # Basic fields that crop yield should have
-        if "year" in crop_data:
-            assert isinstance(crop_data["year"], int)
-            assert crop_data["year"] >= 1980 and crop_data["year"] <= 2030
-
-        if "yield" in crop_data:
-            assert isinstance(crop_data["yield"], int | float)
-            assert crop_data["yield"] >= 0
-
-        if "state" in crop_data:
-            assert isinstance(crop_data["state"], str)
-            assert len(crop_data["state"]) == 2  # State abbreviation
+                self.assert_items(data, "crop_yield")
 
 
 @pytest.mark.integration
@@ -234,15 +204,15 @@ class TestWeatherEndpointsValidation(IntegrationTestBase):
     @pytest.mark.asyncio
     async def test_weather_data_consistency(self):
         """Test weather data consistency across endpoints."""
-        # Get data from enhanced endpoint
-        response_v2 = await self.get(
-            "/api/v2/weather-stations", params={"page_size": 5}
+        # Get data from enhanced and v1 endpoints; neither depends on the other
+        response_v2, response_v1 = await asyncio.gather(
+            self.cached_get("/api/v2/weather-stations", params={"page_size": 5}),
+            self.cached_get("/api/v1/weather/stations"),
         )
         if response_v2.status_code == 200:
             data_v2 = self.assert_json_response(response_v2)
 
-            # Get data from v1 endpoint (if available)
-            response_v1 = await self.get("/api/v1/weather/stations")
+            # v1 data is only compared if that endpoint is available
             if response_v1.status_code == 200:
                 data_v1 = self.assert_json_response(response_v1)
 
@@ -254,8 +224,8 @@ class TestWeatherEndpointsValidation(IntegrationTestBase):
 
                 # At least some stations should be present in both
                 if v2_stations and v1_stations:
-                    v2_ids = {s["station_id"] for s in v2_stations}
-                    v1_ids = {s["station_id"] for s in v1_stations}
+                    v2_ids = set(map(_station_id, v2_stations))
+                    v1_ids = set(map(_station_id, v1_stations))
 
                     # Should have overlap
                     common_ids = v2_ids.intersection(v1_ids)
@@ -266,6 +236,7 @@ class TestWeatherEndpointsValidation(IntegrationTestBase):
     @pytest.mark.asyncio
     async def test_weather_data_temporal_consistency(self):
         """Test temporal consistency of weather data."""
+        first_day, last_day = date(2010, 1, 1), date(2010, 1, 5)
         response = await self.get(
             "/api/v2/daily-weather",
             params={
@@ -280,9 +251,9 @@ class TestWeatherEndpointsValidation(IntegrationTestBase):
 
             # All dates should be within range
             for weather in data["items"]:
-                weather_date = weather["date"]
+                weather_date = date.fromisoformat(weather["date"][:10])
                 assert (
-                    "2010-01-0" in weather_date
+                    first_day <= weather_date <= last_day
                 ), f"Date should be in range: {weather_date}"
 
                 # Temperature relationship should be consistent
@@ -301,18 +272,25 @@ class TestWeatherEndpointsValidation(IntegrationTestBase):
         if response.status_code == 200:
             data = self.assert_json_response(response)
 
-            # All stations should be in Illinois
-            for station in data["items"]:
-                assert station["state"] == "IL", f"Station should be in IL: {station}"
-
-                # Illinois coordinates should be reasonable
-                lat, lon = station["latitude"], station["longitude"]
-                assert 37 <= lat <= 43, f"Illinois latitude should be ~37-43: {lat}"
-                assert (
-                    -92 <= lon <= -87
-                ), f"Illinois longitude should be ~-92 to -87: {lon}"
+            # All stations should be in Illinois, with Illinois coordinates
+            # (latitude ~37-43, longitude ~-92 to -87)
+            outside = next(
+                (
+                    station
+                    for station in data["items"]
+                    if station["state"] != "IL"
+                    or not 37 <= station["latitude"] <= 43
+                    or not -92 <= station["longitude"] <= -87
+                ),
+                None,
+            )
+            assert outside is None, f"Station should be in IL: {outside}"
 
     @pytest.mark.performance
+    @pytest.mark.xdist_group("perf")
+    @pytest.mark.skipif(
+        _TIMING_UNRELIABLE, reason="timing needs an isolated, untraced process"
+    )
     @pytest.mark.asyncio
     async def test_weather_endpoints_performance(self):
         """Test performance of weather endpoints."""
@@ -322,17 +300,26 @@ class TestWeatherEndpointsValidation(IntegrationTestBase):
             "/api/v2/yearly-stats",
         ]
 
-        for endpoint in endpoints:
-            result = await self.measure_response_time(
-                "GET", endpoint, params={"page_size": 10}
+        # Warm up so first-request costs (imports, caches) aren't timed
+        await asyncio.gather(
+            *(self.get(endpoint, params={"page_size": 10}) for endpoint in endpoints)
+        )
+
+        results = await asyncio.gather(
+            *(
+                self.measure_response_time("GET", endpoint, params={"page_size": 10})
+                for endpoint in endpoints
             )
+        )
 
+        for endpoint, result in zip(endpoints, results, strict=True):
             if result["success"]:
                 assert (
                     result["elapsed_time"] < 3.0
                 ), f"Weather endpoint {endpoint} too slow: {result['elapsed_time']}s"
 
     @pytest.mark.slow
+    @pytest.mark.xdist_group("perf")
     @pytest.mark.asyncio
     async def test_large_data_handling(self):
         """Test handling of large data requests."""
@@ -355,6 +342,13 @@ class TestWeatherEndpointsValidation(IntegrationTestBase):
             # Response should be reasonable
             assert len(data["items"]) > 0, "Should return some data"
 
+            # All dates should fall in the requested month
+            first_day, last_day = date(2010, 1, 1), date(2010, 1, 31)
+            dates = [date.fromisoformat(item["date"][:10]) for item in data["items"]]
+            assert all(
+                first_day <= weather_date <= last_day for weather_date in dates
+            ), f"Dates should be in January 2010: {min(dates)} to {max(dates)}"
+
     @pytest.mark.asyncio
     async def test_data_completeness_validation(self):
         """Test data completeness and quality validation."""
@@ -366,14 +360,18 @@ class TestWeatherEndpointsValidation(IntegrationTestBase):
             data = self.assert_json_response(response)
 
             # All records should have temperature data
-            for weather in data["items"]:
-                has_temp = (
-                    weather.get("max_temp") is not None
-                    or weather.get("min_temp") is not None
-                )
-                assert (
-                    has_temp
-                ), f"Should have temperature data when filtered: {weather}"
+            missing = next(
+                (
+                    weather
+                    for weather in data["items"]
+                    if weather.get("max_temp") is None
+                    and weather.get("min_temp") is None
+                ),
+                None,
+            )
+            assert (
+                missing is None
+            ), f"Should have temperature data when filtered: {missing}"
 
 
 @pytest.mark.integration
@@ -382,67 +380,54 @@ class TestWeatherEndpointsIntegration(IntegrationTestBase):
     """Test integration between different weather endpoints."""
 
     @pytest.mark.asyncio
-    async def test_station_weather_data_integration(self):
+    async def test_station_weather_data_integration(self, sample_station_id):
         """Test integration between stations and weather data."""
-        # Get stations
-        stations_response = await self.get(
-            "/api/v2/weather-stations", params={"page_size": 3}
-        )
-
-        if stations_response.status_code == 200:
-            stations_data = self.assert_json_response(stations_response)
-
-            if stations_data["items"]:
-                # Get weather data for first station
-                station = stations_data["items"][0]
-                station_id = station["station_id"]
-
-                weather_response = await self.get(
-                    "/api/v2/daily-weather",
-                    params={"station_ids": [station_id], "page_size": 5},
-                )
+        if sample_station_id is not None:
+            # Get weather data for a known station
+            weather_response = await self.get(
+                "/api/v2/daily-weather",
+                params={"station_ids": [sample_station_id], "page_size": 5},
+            )
 
-                if weather_response.status_code == 200:
-                    weather_data = self.assert_json_response(weather_response)
+            if weather_response.status_code == 200:
+                weather_data = self.assert_json_response(weather_response)
 
-                    # Weather data should be from the requested station
-                    for weather in weather_data["items"]:
-                        if isinstance(weather["station"], dict):
-                            assert weather["station"]["station_id"] == station_id
-                        # Note: might be just ID in some implementations
+                # Weather data should be from the requested station
+                for weather in weather_data["items"]:
+                    if isinstance(weather["station"], dict):
+                        assert weather["station"]["station_id"] == sample_station_id
+                    # Note: might be just ID in some implementations
 
     @pytest.mark.asyncio
-    async def test_yearly_stats_integration(self):
+    async def test_yearly_stats_integration(self, sample_year):
         """Test integration between daily weather and yearly stats."""
-        # Get yearly stats
-        stats_response = await self.get("/api/v2/yearly-stats", params={"page_size": 1})
-
-        if stats_response.status_code == 200:
-            stats_data = self.assert_json_response(stats_response)
-
-            if stats_data["items"]:
-                stat = stats_data["items"][0]
-                year = stat["year"]
-
-                # Get daily weather for same year
-                daily_response = await self.get(
-                    "/api/v2/daily-weather",
-                    params={
-                        "start_date": f"{year}-01-01",
-                        "end_date": f"{year}-12-31",
-                        "page_size": 10,
-                    },
-                )
-
-                if daily_response.status_code == 200:
-                    daily_data = self.assert_json_response(daily_response)
+        if sample_year is not None:
+            # Get daily weather for a year with yearly stats
+            daily_response = await self.get(
+                "/api/v2/daily-weather",
+                params={
+                    "start_date": f"{sample_year}-01-01",
+                    "end_date": f"{sample_year}-12-31",
+                    "page_size": 10,
+                },
+            )
 
-                    # Should have daily data for the year
-                    for weather in daily_data["items"]:
-                        weather_year = int(weather["date"].split("-")[0])
-                        assert (
-                            weather_year == year
-                        ), f"Weather year should match: {weather_year} vs {year}"
+            if daily_response.status_code == 200:
+                daily_data = self.assert_json_response(daily_response)
+
+                # Should have daily data for the year
+                prefix = f"{sample_year}-"
+                mismatch = next(
+                    (
+                        weather["date"]
+                        for weather in daily_data["items"]
+                        if not weather["date"].startswith(prefix)
+                    ),
+                    None,
+                )
+                assert (
+                    mismatch is None
+                ), f"Weather year should match: {mismatch} vs {sample_year}"
 
 
 if __name__ == "__main__":